@@ -0,0 +1,43 @@
+{#
+  Pre-hook applying the DuckDB settings for a model's cost class (config.meta.cost_class).
+
+  DuckDB settings are instance wide, so they only isolate a model when it runs on its own.
+  scripts/python/schedule_duckdb_run.py runs heavy models one at a time and fans light and
+  medium models out across dbt threads, enabling this hook with `duckdb_cost_scheduling: true`.
+  The script also passes duckdb_round_settings (threads and memory_limit) for each round, which
+  override the class settings. Settings neither defines are reset to the DuckDB default.
+#}
+{% macro apply_cost_class() %}
+    {%- if target.type != 'duckdb' or not var('duckdb_cost_scheduling', false) -%}
+        {{ return('') }}
+    {%- endif -%}
+
+    {%- set profile = var('duckdb_cost_profile', {}) -%}
+    {%- set cost_class = model.config.get('meta', {}).get('cost_class', 'light') -%}
+    {%- set round_settings = var('duckdb_round_settings', {}) -%}
+    {%- set class_settings = dict(profile.get(cost_class, {})) -%}
+    {% do class_settings.update(round_settings) %}
+
+    {%- set setting_names = [] -%}
+    {%- for settings in profile.values() | list + [round_settings] -%}
+        {%- for name in settings -%}
+            {%- if name not in setting_names -%}
+                {% do setting_names.append(name) %}
+            {%- endif -%}
+        {%- endfor -%}
+    {%- endfor -%}
+
+    {%- set statements = [] -%}
+    {%- for name in setting_names -%}
+        {%- set value = class_settings.get(name) -%}
+        {%- if value is none -%}
+            {% do statements.append("RESET " ~ name) %}
+        {%- elif value is string -%}
+            {% do statements.append("SET " ~ name ~ " = '" ~ value ~ "'") %}
+        {%- else -%}
+            {% do statements.append("SET " ~ name ~ " = " ~ value) %}
+        {%- endif -%}
+    {%- endfor -%}
+
+    {{ return(statements | join(";\n")) }}
+{% endmacro %}
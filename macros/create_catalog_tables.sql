@@ -0,0 +1,40 @@
+{% macro create_catalog_table(schema, table, spec) %}
+    {%- set columns = [] -%}
+    {%- for column_name, data_type, not_null in spec["columns"] -%}
+        {% do columns.append(adapter.quote(column_name) ~ " " ~ data_type ~ (" NOT NULL" if not_null else " NULL")) %}
+    {%- endfor -%}
+    CREATE TABLE {{ schema }}.{{ table }} (
+        {{ columns | join(",\n        ") }}
+    );
+{% endmacro %}
+
+{% macro create_catalog_tables(group, schema) %}
+    {% set database = target.database %}
+    {% do adapter.create_schema(api.Relation.create(database=database, schema=schema)) %}
+    {% set sql %}
+        {% for table, spec in get_schema_catalog()[group].items() %}
+            {% if not check_if_exists(database, schema, table) %}
+                {{ create_catalog_table(schema, table, spec) }}
+            {% endif %}
+        {% endfor %}
+        COMMIT;
+    {% endset %}
+
+    {% do run_query(sql) %}
+{% endmacro %}
+
+{# Run once the tables have been loaded, e.g. dbt run-operation create_catalog_indexes --args "{vocab_tables: true}" #}
+{% macro create_catalog_indexes(vocab_tables) %}
+    {% if vocab_tables %}
+        {% set group, schema = "vocabulary", target.schema %}
+    {% else %}
+        {% set group, schema = "synthea", target.schema ~ '_synthea' %}
+    {% endif %}
+    {% for table, spec in get_schema_catalog()[group].items() %}
+        {% if check_if_exists(target.database, schema, table) %}
+            {% for columns in spec["indexes"] %}
+                {% do run_query("CREATE INDEX IF NOT EXISTS idx_" ~ table ~ "_" ~ columns | join("_") ~ " ON " ~ schema ~ "." ~ table ~ " (" ~ columns | join(", ") ~ ");") %}
+            {% endfor %}
+        {% endif %}
+    {% endfor %}
+{% endmacro %}
@@ -0,0 +1,30 @@
+{#
+  Every drug concept and the RxNorm ingredients it rolls up to, as selected by int__drug_ingredient.
+#}
+{%- macro drug_ingredient_rows() -%}
+    SELECT
+        ca.descendant_concept_id AS drug_concept_id
+        , c.concept_id AS ingredient_concept_id
+    FROM {{ ref ('stg_vocabulary__concept_ancestor') }} AS ca
+    INNER JOIN {{ ref ('stg_vocabulary__concept') }} AS c
+        ON ca.ancestor_concept_id = c.concept_id
+    WHERE
+        c.vocabulary_id = 'RxNorm'
+        AND c.concept_class_id = 'Ingredient'
+{%- endmacro -%}
+
+
+{#
+  A cheap key for the vocabulary int__drug_ingredient was built from: the release of the 'None'
+  vocabulary and the row counts of CONCEPT and CONCEPT_ANCESTOR. Pruned loads and vocabulary
+  shards change the counts without changing the release, and counting rows needs no join.
+#}
+{%- macro drug_ingredient_source_key() -%}
+    (
+        SELECT COALESCE(MAX(vocabulary_version), '')
+        FROM {{ ref ('stg_vocabulary__vocabulary') }}
+        WHERE vocabulary_id = 'None'
+    )
+    || ':' || CAST((SELECT COUNT(*) FROM {{ ref ('stg_vocabulary__concept') }}) AS {{ dbt.type_string() }})
+    || ':' || CAST((SELECT COUNT(*) FROM {{ ref ('stg_vocabulary__concept_ancestor') }}) AS {{ dbt.type_string() }})
+{%- endmacro -%}
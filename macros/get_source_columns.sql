@@ -0,0 +1,58 @@
+{#
+  Return the column names of a source table, as dbt_utils.get_filtered_columns_in_relation does.
+
+  With `source_columns_cache: true` the columns of every source table are fetched with a single
+  information_schema query the first time a staging model is compiled, and memoised on the graph
+  for the rest of the invocation. Tables missing from the cache fall back to live introspection.
+#}
+{% macro get_source_columns(source_name, table_name) %}
+    {%- set relation = source(source_name, table_name) -%}
+    {%- if not execute -%}
+        {{ return('') }}
+    {%- endif -%}
+
+    {%- if var('source_columns_cache', false) -%}
+        {%- set cache = load_source_columns_cache() -%}
+        {%- set key = (relation.database ~ '.' ~ relation.schema ~ '.' ~ relation.identifier) | lower -%}
+        {%- if key in cache -%}
+            {{ return(cache[key]) }}
+        {%- endif -%}
+    {%- endif -%}
+
+    {{ return(dbt_utils.get_filtered_columns_in_relation(relation)) }}
+{% endmacro %}
+
+{% macro load_source_columns_cache() %}
+    {%- if 'source_columns_cache' in graph -%}
+        {{ return(graph['source_columns_cache']) }}
+    {%- endif -%}
+
+    {%- set schemas = [] -%}
+    {%- for node in graph.sources.values() -%}
+        {%- set schema_filter = "(lower(table_catalog) = '" ~ node.database | lower ~ "' AND lower(table_schema) = '" ~ node.schema | lower ~ "')" -%}
+        {%- if schema_filter not in schemas -%}
+            {% do schemas.append(schema_filter) %}
+        {%- endif -%}
+    {%- endfor -%}
+
+    {%- set cache = {} -%}
+    {%- if schemas -%}
+        {%- set sql -%}
+            SELECT
+                lower(table_catalog || '.' || table_schema || '.' || table_name) AS relation_key
+                , column_name
+            FROM information_schema.columns
+            WHERE {{ schemas | join(' OR ') }}
+            ORDER BY table_catalog, table_schema, table_name, ordinal_position
+        {%- endset -%}
+        {%- for row in run_query(sql) -%}
+            {%- if row[0] not in cache -%}
+                {% do cache.update({row[0]: []}) %}
+            {%- endif -%}
+            {% do cache[row[0]].append(row[1]) %}
+        {%- endfor -%}
+    {%- endif -%}
+
+    {% do graph.update({'source_columns_cache': cache}) %}
+    {{ return(cache) }}
+{% endmacro %}
@@ -1,37 +1,68 @@
-{% macro load_data_duckdb(file_dict, vocab_tables) %}
+{% macro load_data_duckdb(file_dict, vocab_tables, prune_vocab=false) %}
 {% if vocab_tables %}
     {% set target_schema = target.schema %}
+    {% set catalog = get_schema_catalog()["vocabulary"] %}
   {% else %}
 {% set target_schema = target.schema ~ '_synthea' %}
+{% set catalog = get_schema_catalog()["synthea"] %}
 {% endif %}
 
-{% set first_key, first_val = (file_dict | dictsort | first) %}
-{% set parquet = first_val.endswith(".parquet") %}
-{% set csv = first_val.endswith(".csv") %}
-
 {% do run_query("CREATE SCHEMA IF NOT EXISTS " ~ target_schema ~ ";") %}
 
+{# Each table maps to a file path, or a list of paths and globs that are read as one table. #}
+{% set sources = {} %}
+{% set parquet_tables = [] %}
 {% for n, p in file_dict.items() %}
-    {% set table = n.lower() %}
-    {% if parquet %}
-        {% do run_query("DROP VIEW IF EXISTS " ~ target_schema ~ "." ~ table ~ ";") %}
-        {% do run_query("CREATE VIEW IF NOT EXISTS " ~ target_schema ~ "." ~ table ~ " AS SELECT * FROM read_parquet('" ~ p ~ "');") %}
-    {% elif csv %}
-        {% do run_query("DROP TABLE IF EXISTS " ~ target_schema ~ "." ~ table ~ ";") %}
-        {% do run_query("CREATE TABLE IF NOT EXISTS " ~ target_schema ~ "." ~ table ~ " AS SELECT * FROM read_csv('" ~ p ~ "', quote = '');") %}
+    {% set paths = [p] if p is string else p %}
+    {% do parquet_tables.append(n.lower()) if paths[0].endswith(".parquet") %}
+    {% do sources.update({n.lower(): duckdb_read_source(paths, catalog.get(n.lower()), vocab_tables)}) %}
+{% endfor %}
+
+{# Pruned vocabulary tables are filtered copies, so they are always materialised as tables. #}
+{% if vocab_tables and prune_vocab %}
+    {% set sources = prune_vocab_sources(sources, target.schema ~ '_synthea') %}
+{% endif %}
+
+{% for table, source_sql in sources.items() %}
+    {# Drop whatever is there first, as a table can replace a view and vice versa. #}
+    {% set existing = adapter.get_relation(database=target.database, schema=target_schema, identifier=table) %}
+    {% if existing %}
+        {% do adapter.drop_relation(existing) %}
+    {% endif %}
+    {% if table in parquet_tables and not (vocab_tables and prune_vocab) %}
+        {% do run_query("CREATE VIEW " ~ target_schema ~ "." ~ table ~ " AS " ~ source_sql ~ ";") %}
+    {% else %}
+        {% do run_query("CREATE TABLE " ~ target_schema ~ "." ~ table ~ " AS " ~ source_sql ~ ";") %}
     {% endif %}
 {% endfor %}
+{% do run_query("DROP TABLE IF EXISTS " ~ target.schema ~ ".vocab_prune_concept_ids;") if vocab_tables and prune_vocab %}
+{# Relation lookups open a transaction, which must be committed. #}
+{% do run_query("COMMIT;") %}
+{% endmacro %}
 
-{% if csv %}
-    {% if vocab_tables %}
-        {% for table in ['concept', 'concept_relationship', 'drug_strength'] %}
-            {% do run_query("ALTER TABLE " ~ target_schema ~ "." ~ table ~ " ALTER valid_start_date TYPE DATE USING strptime(CAST(valid_start_date AS VARCHAR), '%Y%m%d');") %}
-            {% do run_query("ALTER TABLE " ~ target_schema ~ "." ~ table ~ " ALTER valid_end_date TYPE DATE USING strptime(CAST(valid_end_date AS VARCHAR), '%Y%m%d');") %}
+{#
+  Return a SELECT reading a list of csv or parquet files (or globs) as one table.
+  Catalogued csv files are read with explicit column types so DuckDB does not sniff them, anything
+  else is matched up by column name so batches with differing columns can be read together.
+#}
+{% macro duckdb_read_source(paths, table_spec, vocab_tables) %}
+    {% set file_list = "['" ~ paths | join("', '") ~ "']" %}
+    {% if paths[0].endswith(".parquet") %}
+        {{ return("SELECT * FROM read_parquet(" ~ file_list ~ ", union_by_name = true)") }}
+    {% endif %}
+    {% set csv_options = ["quote = ''"] %}
+    {% if table_spec %}
+        {% set column_types = [] %}
+        {% for column_name, data_type, not_null in table_spec["columns"] %}
+            {% do column_types.append("'" ~ column_name ~ "': '" ~ data_type ~ "'") %}
         {% endfor %}
+        {% do csv_options.append("header = true") %}
+        {% do csv_options.append("columns = {" ~ column_types | join(", ") ~ "}") %}
+        {% if vocab_tables %}
+            {% do csv_options.append("dateformat = '%Y%m%d'") %}
+        {% endif %}
     {% else %}
-        {% for table in ['medications', 'allergies', 'conditions', 'devices', 'procedures'] %}
-            {% do run_query("ALTER TABLE " ~ target_schema ~ "." ~ table ~ " ALTER CODE TYPE VARCHAR;") %}
-        {% endfor %}
+        {% do csv_options.append("union_by_name = true") %}
     {% endif %}
-{% endif %}
+    {{ return("SELECT * FROM read_csv(" ~ file_list ~ ", " ~ csv_options | join(", ") ~ ")") }}
 {% endmacro %}
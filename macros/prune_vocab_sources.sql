@@ -0,0 +1,107 @@
+{#
+  Restrict the vocabulary files loaded by load_data_duckdb to the concepts a Synthea dataset needs.
+
+  The Synthea tables must already be loaded. The concept closure is:
+   - concepts in `vocab_prune_vocabularies` whose code appears in a Synthea code column,
+     plus every concept in `vocab_prune_keep_domains` (type, gender, race, visit concepts etc.).
+   - the targets of their 'Maps to' relationships.
+   - the ancestors of all of the above.
+   - the ingredients and units of their drug_strength rows.
+  It is stored in <target schema>.vocab_prune_concept_ids, and the returned SELECTs filter the
+  large vocabulary tables to it. The smaller tables are loaded in full.
+#}
+{% macro prune_vocab_sources(sources, synthea_schema) %}
+    {%- set code_columns = {
+        "allergies": ["code", "reaction1", "reaction2"],
+        "careplans": ["code", "reasoncode"],
+        "conditions": ["code"],
+        "devices": ["code"],
+        "encounters": ["code", "reasoncode"],
+        "imaging_studies": ["bodysite_code", "modality_code", "procedure_code"],
+        "immunizations": ["code"],
+        "medications": ["code", "reasoncode"],
+        "observations": ["code", "value", "units"],
+        "procedures": ["code", "reasoncode"],
+        "supplies": ["code"],
+    } -%}
+    {%- if "concept" not in sources -%}
+        {{ exceptions.raise_compiler_error("Pruning the vocabulary requires a CONCEPT file.") }}
+    {%- endif -%}
+
+    {%- set code_queries = [] -%}
+    {%- for table, columns in code_columns.items() -%}
+        {%- set relation = adapter.get_relation(database=target.database, schema=synthea_schema, identifier=table) -%}
+        {%- if relation -%}
+            {%- set existing_columns = adapter.get_columns_in_relation(relation) | map(attribute="name") | map("lower") | list -%}
+            {%- for column in columns if column in existing_columns -%}
+                {% do code_queries.append("SELECT CAST(" ~ column ~ " AS VARCHAR) AS code FROM " ~ relation) %}
+            {%- endfor -%}
+        {%- endif -%}
+    {%- endfor -%}
+    {%- if not code_queries -%}
+        {{ exceptions.raise_compiler_error("No Synthea tables found in " ~ synthea_schema ~ ". Load the Synthea data before pruning the vocabulary.") }}
+    {%- endif -%}
+
+    {%- set concept_ids = target.schema ~ ".vocab_prune_concept_ids" -%}
+    {%- set closure = concept_ids ~ "_closure" -%}
+    {%- set in_closure = " IN (SELECT concept_id FROM " ~ closure ~ ")" -%}
+    {% set sql %}
+        CREATE OR REPLACE TABLE {{ closure }} AS
+        WITH codes AS (
+            SELECT DISTINCT code FROM ({{ code_queries | join("\n            UNION ALL ") }})
+            WHERE code IS NOT NULL
+        )
+        SELECT concept_id
+        FROM ({{ sources["concept"] }})
+        WHERE (
+            vocabulary_id IN ('{{ var("vocab_prune_vocabularies") | join("', '") }}')
+            AND concept_code IN (SELECT code FROM codes)
+        )
+        OR domain_id IN ('{{ var("vocab_prune_keep_domains") | join("', '") }}');
+
+        {% if "concept_relationship" in sources %}
+        INSERT INTO {{ closure }}
+        SELECT concept_id_2
+        FROM ({{ sources["concept_relationship"] }})
+        WHERE relationship_id IN ('Maps to', 'Maps to value', 'Maps to unit')
+            AND concept_id_1 {{ in_closure }};
+        {% endif %}
+
+        {% if "concept_ancestor" in sources %}
+        INSERT INTO {{ closure }}
+        SELECT ancestor_concept_id
+        FROM ({{ sources["concept_ancestor"] }})
+        WHERE descendant_concept_id {{ in_closure }};
+        {% endif %}
+
+        {% if "drug_strength" in sources %}
+        INSERT INTO {{ closure }}
+        SELECT unnest([ingredient_concept_id, amount_unit_concept_id, numerator_unit_concept_id, denominator_unit_concept_id])
+        FROM ({{ sources["drug_strength"] }})
+        WHERE drug_concept_id {{ in_closure }};
+        {% endif %}
+
+        CREATE OR REPLACE TABLE {{ concept_ids }} AS
+        SELECT DISTINCT concept_id FROM {{ closure }} WHERE concept_id IS NOT NULL;
+        DROP TABLE {{ closure }};
+    {% endset %}
+    {% do run_query(sql) %}
+
+    {%- set in_concept_ids = " IN (SELECT concept_id FROM " ~ concept_ids ~ ")" -%}
+    {%- set filters = {
+        "concept": "concept_id" ~ in_concept_ids,
+        "concept_synonym": "concept_id" ~ in_concept_ids,
+        "concept_relationship": "concept_id_1" ~ in_concept_ids ~ " AND concept_id_2" ~ in_concept_ids,
+        "concept_ancestor": "ancestor_concept_id" ~ in_concept_ids ~ " AND descendant_concept_id" ~ in_concept_ids,
+        "drug_strength": "drug_concept_id" ~ in_concept_ids,
+    } -%}
+    {%- set pruned = {} -%}
+    {%- for table, source_sql in sources.items() -%}
+        {%- if table in filters -%}
+            {% do pruned.update({table: "SELECT * FROM (" ~ source_sql ~ ") WHERE " ~ filters[table]}) %}
+        {%- else -%}
+            {% do pruned.update({table: source_sql}) %}
+        {%- endif -%}
+    {%- endfor -%}
+    {{ return(pruned) }}
+{% endmacro %}
@@ -0,0 +1,22 @@
+{#
+  A fingerprint of a set of rows: the row count and the sum of a hash of the given columns,
+  e.g. '1234:98765432101'. Any added, removed or changed row alters it, independent of row order.
+  Pass window = 'OVER ()' to attach the fingerprint of the whole result to every row.
+#}
+{%- macro row_set_fingerprint(columns, window='') -%}
+    CAST(COUNT(*) {{ window }} AS {{ dbt.type_string() }})
+    || ':'
+    || CAST(COALESCE(SUM({{ integer_hash(columns) }}) {{ window }}, 0) AS {{ dbt.type_string() }})
+{%- endmacro -%}
+
+{%- macro integer_hash(columns) -%}
+    {{ return(adapter.dispatch("integer_hash")(columns)) }}
+{%- endmacro -%}
+
+{% macro default__integer_hash(columns) %}
+    hashtextextended(CONCAT_WS('|', {{ columns | join(', ') }}), 0)
+{% endmacro %}
+
+{% macro duckdb__integer_hash(columns) %}
+    hash({{ columns | join(', ') }})
+{% endmacro %}
@@ -0,0 +1,13 @@
+{# Generated by scripts/python/schema_catalog.py dbt-macro. Do not edit by hand. #}
+
+{% macro get_schema_catalog() %}
+    {{ return(adapter.dispatch('get_schema_catalog')()) }}
+{% endmacro %}
+
+{% macro default__get_schema_catalog() %}
+    {{ return({"vocabulary": {"concept": {"columns": [["concept_id", "INTEGER", true], ["concept_name", "VARCHAR(255)", true], ["domain_id", "VARCHAR(20)", true], ["vocabulary_id", "VARCHAR(20)", true], ["concept_class_id", "VARCHAR(20)", true], ["standard_concept", "VARCHAR(1)", false], ["concept_code", "VARCHAR(50)", true], ["valid_start_date", "DATE", true], ["valid_end_date", "DATE", true], ["invalid_reason", "VARCHAR(1)", false]], "indexes": [["concept_id"], ["concept_code"], ["vocabulary_id"], ["domain_id"], ["concept_class_id"]]}, "vocabulary": {"columns": [["vocabulary_id", "VARCHAR(20)", true], ["vocabulary_name", "VARCHAR(255)", true], ["vocabulary_reference", "VARCHAR(255)", false], ["vocabulary_version", "VARCHAR(255)", false], ["vocabulary_concept_id", "INTEGER", true]], "indexes": [["vocabulary_id"]]}, "domain": {"columns": [["domain_id", "VARCHAR(20)", true], ["domain_name", "VARCHAR(255)", true], ["domain_concept_id", "INTEGER", true]], "indexes": [["domain_id"]]}, "concept_class": {"columns": [["concept_class_id", "VARCHAR(20)", true], ["concept_class_name", "VARCHAR(255)", true], ["concept_class_concept_id", "INTEGER", true]], "indexes": [["concept_class_id"]]}, "concept_relationship": {"columns": [["concept_id_1", "INTEGER", true], ["concept_id_2", "INTEGER", true], ["relationship_id", "VARCHAR(20)", true], ["valid_start_date", "DATE", true], ["valid_end_date", "DATE", true], ["invalid_reason", "VARCHAR(1)", false]], "indexes": [["concept_id_1"], ["concept_id_2"], ["relationship_id"]]}, "relationship": {"columns": [["relationship_id", "VARCHAR(20)", true], ["relationship_name", "VARCHAR(255)", true], ["is_hierarchical", "VARCHAR(1)", true], ["defines_ancestry", "VARCHAR(1)", true], ["reverse_relationship_id", "VARCHAR(20)", true], ["relationship_concept_id", "INTEGER", true]], "indexes": [["relationship_id"]]}, "concept_synonym": {"columns": [["concept_id", "INTEGER", true], ["concept_synonym_name", "VARCHAR(1000)", true], ["language_concept_id", "INTEGER", true]], "indexes": [["concept_id"]]}, "concept_ancestor": {"columns": [["ancestor_concept_id", "INTEGER", true], ["descendant_concept_id", "INTEGER", true], ["min_levels_of_separation", "INTEGER", true], ["max_levels_of_separation", "INTEGER", true]], "indexes": [["ancestor_concept_id"], ["descendant_concept_id"]]}, "source_to_concept_map": {"columns": [["source_code", "VARCHAR(50)", true], ["source_concept_id", "INTEGER", true], ["source_vocabulary_id", "VARCHAR(20)", true], ["source_code_description", "VARCHAR(255)", false], ["target_concept_id", "INTEGER", true], ["target_vocabulary_id", "VARCHAR(20)", true], ["valid_start_date", "DATE", true], ["valid_end_date", "DATE", true], ["invalid_reason", "VARCHAR(1)", false]], "indexes": [["source_vocabulary_id"], ["target_concept_id"], ["source_code"]]}, "drug_strength": {"columns": [["drug_concept_id", "INTEGER", true], ["ingredient_concept_id", "INTEGER", true], ["amount_value", "NUMERIC", false], ["amount_unit_concept_id", "INTEGER", false], ["numerator_value", "NUMERIC", false], ["numerator_unit_concept_id", "INTEGER", false], ["denominator_value", "NUMERIC", false], ["denominator_unit_concept_id", "INTEGER", false], ["box_size", "INTEGER", false], ["valid_start_date", "DATE", true], ["valid_end_date", "DATE", true], ["invalid_reason", "VARCHAR(1)", false]], "indexes": [["drug_concept_id"], ["ingredient_concept_id"]]}}, "synthea": {"allergies": {"columns": [["start", "DATE", false], ["stop", "DATE", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["system", "VARCHAR(255)", false], ["description", "VARCHAR(255)", false], ["type", "VARCHAR(255)", false], ["category", "VARCHAR(255)", false], ["reaction1", "VARCHAR(255)", false], ["description1", "VARCHAR(255)", false], ["severity1", "VARCHAR(255)", false], ["reaction2", "VARCHAR(255)", false], ["description2", "VARCHAR(255)", false], ["severity2", "VARCHAR(255)", false]], "indexes": []}, "careplans": {"columns": [["id", "VARCHAR(1000)", false], ["start", "DATE", false], ["stop", "DATE", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["description", "VARCHAR(255)", false], ["reasoncode", "VARCHAR(255)", false], ["reasondescription", "VARCHAR(255)", false]], "indexes": []}, "claims": {"columns": [["id", "VARCHAR(1000)", false], ["patientid", "VARCHAR(1000)", false], ["providerid", "VARCHAR(1000)", false], ["primarypatientinsuranceid", "VARCHAR(1000)", false], ["secondarypatientinsuranceid", "VARCHAR(1000)", false], ["departmentid", "VARCHAR(1000)", false], ["patientdepartmentid", "VARCHAR(1000)", false], ["diagnosis1", "VARCHAR(1000)", false], ["diagnosis2", "VARCHAR(1000)", false], ["diagnosis3", "VARCHAR(1000)", false], ["diagnosis4", "VARCHAR(1000)", false], ["diagnosis5", "VARCHAR(1000)", false], ["diagnosis6", "VARCHAR(1000)", false], ["diagnosis7", "VARCHAR(1000)", false], ["diagnosis8", "VARCHAR(1000)", false], ["referringproviderid", "VARCHAR(1000)", false], ["appointmentid", "VARCHAR(1000)", false], ["currentillnessdate", "TIMESTAMPTZ", false], ["servicedate", "TIMESTAMPTZ", false], ["supervisingproviderid", "VARCHAR(1000)", false], ["status1", "VARCHAR(1000)", false], ["status2", "VARCHAR(1000)", false], ["statusp", "VARCHAR(1000)", false], ["outstanding1", "NUMERIC", false], ["outstanding2", "NUMERIC", false], ["outstandingp", "NUMERIC", false], ["lastbilleddate1", "TIMESTAMPTZ", false], ["lastbilleddate2", "TIMESTAMPTZ", false], ["lastbilleddatep", "TIMESTAMPTZ", false], ["healthcareclaimtypeid1", "NUMERIC", false], ["healthcareclaimtypeid2", "NUMERIC", false]], "indexes": []}, "claims_transactions": {"columns": [["id", "VARCHAR(1000)", false], ["claimid", "VARCHAR(1000)", false], ["chargeid", "NUMERIC", false], ["patientid", "VARCHAR(1000)", false], ["type", "VARCHAR(1000)", false], ["amount", "NUMERIC", false], ["method", "VARCHAR(1000)", false], ["fromdate", "TIMESTAMPTZ", false], ["todate", "TIMESTAMPTZ", false], ["placeofservice", "VARCHAR(1000)", false], ["procedurecode", "VARCHAR(1000)", false], ["modifier1", "VARCHAR(1000)", false], ["modifier2", "VARCHAR(1000)", false], ["diagnosisref1", "NUMERIC", false], ["diagnosisref2", "NUMERIC", false], ["diagnosisref3", "NUMERIC", false], ["diagnosisref4", "NUMERIC", false], ["units", "NUMERIC", false], ["departmentid", "NUMERIC", false], ["notes", "VARCHAR(1000)", false], ["unitamount", "NUMERIC", false], ["transferoutid", "NUMERIC", false], ["transfertype", "VARCHAR(1000)", false], ["payments", "NUMERIC", false], ["adjustments", "NUMERIC", false], ["transfers", "NUMERIC", false], ["outstanding", "NUMERIC", false], ["appointmentid", "VARCHAR(1000)", false], ["linenote", "VARCHAR(1000)", false], ["patientinsuranceid", "VARCHAR(1000)", false], ["feescheduleid", "NUMERIC", false], ["providerid", "VARCHAR(1000)", false], ["supervisingproviderid", "VARCHAR(1000)", false]], "indexes": []}, "conditions": {"columns": [["start", "DATE", false], ["stop", "DATE", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["description", "VARCHAR(255)", false]], "indexes": []}, "devices": {"columns": [["start", "TIMESTAMPTZ", false], ["stop", "TIMESTAMPTZ", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["description", "VARCHAR(255)", false], ["udi", "VARCHAR(255)", false]], "indexes": []}, "encounters": {"columns": [["id", "VARCHAR(1000)", false], ["start", "TIMESTAMPTZ", false], ["stop", "TIMESTAMPTZ", false], ["patient", "VARCHAR(1000)", false], ["organization", "VARCHAR(1000)", false], ["provider", "VARCHAR(1000)", false], ["payer", "VARCHAR(1000)", false], ["encounterclass", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["description", "VARCHAR(255)", false], ["base_encounter_cost", "NUMERIC", false], ["total_claim_cost", "NUMERIC", false], ["payer_coverage", "NUMERIC", false], ["reasoncode", "VARCHAR(100)", false], ["reasondescription", "VARCHAR(255)", false]], "indexes": [["id"], ["patient"]]}, "imaging_studies": {"columns": [["id", "VARCHAR(1000)", false], ["date", "TIMESTAMPTZ", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["series_uid", "VARCHAR(1000)", false], ["bodysite_code", "VARCHAR(100)", false], ["bodysite_description", "VARCHAR(255)", false], ["modality_code", "VARCHAR(100)", false], ["modality_description", "VARCHAR(255)", false], ["instance_uid", "VARCHAR(1000)", false], ["sop_code", "VARCHAR(100)", false], ["sop_description", "VARCHAR(255)", false], ["procedure_code", "VARCHAR(255)", false]], "indexes": []}, "immunizations": {"columns": [["date", "TIMESTAMPTZ", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["description", "VARCHAR(255)", false], ["base_cost", "NUMERIC", false]], "indexes": []}, "medications": {"columns": [["start", "TIMESTAMPTZ", false], ["stop", "TIMESTAMPTZ", false], ["patient", "VARCHAR(1000)", false], ["payer", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["description", "VARCHAR(1000)", false], ["base_cost", "NUMERIC", false], ["payer_coverage", "NUMERIC", false], ["dispenses", "INTEGER", false], ["totalcost", "NUMERIC", false], ["reasoncode", "VARCHAR(100)", false], ["reasondescription", "VARCHAR(255)", false]], "indexes": []}, "observations": {"columns": [["date", "TIMESTAMPTZ", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["category", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["description", "VARCHAR(255)", false], ["value", "VARCHAR(1000)", false], ["units", "VARCHAR(100)", false], ["type", "VARCHAR(100)", false]], "indexes": [["patient"], ["encounter"]]}, "organizations": {"columns": [["id", "VARCHAR(1000)", false], ["name", "VARCHAR(1000)", false], ["address", "VARCHAR(1000)", false], ["city", "VARCHAR(100)", false], ["state", "VARCHAR(100)", false], ["zip", "VARCHAR(100)", false], ["lat", "NUMERIC", false], ["lon", "NUMERIC", false], ["phone", "VARCHAR(100)", false], ["revenue", "NUMERIC", false], ["utilization", "VARCHAR(100)", false]], "indexes": []}, "patients": {"columns": [["id", "VARCHAR(1000)", false], ["birthdate", "DATE", false], ["deathdate", "DATE", false], ["ssn", "VARCHAR(100)", false], ["drivers", "VARCHAR(100)", false], ["passport", "VARCHAR(100)", false], ["prefix", "VARCHAR(100)", false], ["first", "VARCHAR(100)", false], ["last", "VARCHAR(100)", false], ["suffix", "VARCHAR(100)", false], ["maiden", "VARCHAR(100)", false], ["marital", "VARCHAR(100)", false], ["race", "VARCHAR(100)", false], ["ethnicity", "VARCHAR(100)", false], ["gender", "VARCHAR(100)", false], ["birthplace", "VARCHAR(100)", false], ["address", "VARCHAR(100)", false], ["city", "VARCHAR(100)", false], ["state", "VARCHAR(100)", false], ["county", "VARCHAR(100)", false], ["zip", "VARCHAR(100)", false], ["lat", "NUMERIC", false], ["lon", "NUMERIC", false], ["healthcare_expenses", "NUMERIC", false], ["healthcare_coverage", "NUMERIC", false]], "indexes": [["id"]]}, "payer_transitions": {"columns": [["patient", "VARCHAR(1000)", false], ["memberid", "VARCHAR(1000)", false], ["start_year", "TIMESTAMPTZ", false], ["end_year", "TIMESTAMPTZ", false], ["payer", "VARCHAR(1000)", false], ["secondary_payer", "VARCHAR(1000)", false], ["ownership", "VARCHAR(1000)", false], ["ownername", "VARCHAR(1000)", false]], "indexes": []}, "payers": {"columns": [["id", "VARCHAR(1000)", false], ["name", "VARCHAR(1000)", false], ["address", "VARCHAR(1000)", false], ["city", "VARCHAR(1000)", false], ["state_headquartered", "VARCHAR(1000)", false], ["zip", "VARCHAR(1000)", false], ["phone", "VARCHAR(1000)", false], ["amount_covered", "NUMERIC", false], ["amount_uncovered", "NUMERIC", false], ["revenue", "NUMERIC", false], ["covered_encounters", "NUMERIC", false], ["uncovered_encounters", "NUMERIC", false], ["covered_medications", "NUMERIC", false], ["uncovered_medications", "NUMERIC", false], ["covered_procedures", "NUMERIC", false], ["uncovered_procedures", "NUMERIC", false], ["covered_immunizations", "NUMERIC", false], ["uncovered_immunizations", "NUMERIC", false], ["unique_customers", "NUMERIC", false], ["qols_avg", "NUMERIC", false], ["member_months", "NUMERIC", false]], "indexes": []}, "procedures": {"columns": [["start", "TIMESTAMPTZ", false], ["stop", "TIMESTAMPTZ", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["code", "VARCHAR(100)", false], ["description", "VARCHAR(255)", false], ["base_cost", "NUMERIC", false], ["reasoncode", "VARCHAR(1000)", false], ["reasondescription", "VARCHAR(1000)", false]], "indexes": []}, "providers": {"columns": [["id", "VARCHAR(1000)", false], ["organization", "VARCHAR(1000)", false], ["name", "VARCHAR(100)", false], ["gender", "VARCHAR(100)", false], ["speciality", "VARCHAR(100)", false], ["address", "VARCHAR(255)", false], ["city", "VARCHAR(100)", false], ["state", "VARCHAR(100)", false], ["zip", "VARCHAR(100)", false], ["lat", "NUMERIC", false], ["lon", "NUMERIC", false], ["utilization", "NUMERIC", false]], "indexes": []}, "supplies": {"columns": [["date", "DATE", false], ["patient", "VARCHAR(1000)", false], ["encounter", "VARCHAR(1000)", false], ["code", "VARCHAR(1000)", false], ["description", "VARCHAR(1000)", false], ["quantity", "NUMERIC", false]], "indexes": []}}}) }}
+{% endmacro %}
+
+{% macro duckdb__get_schema_catalog() %}
+    {{ return({"vocabulary": {"concept": {"columns": [["concept_id", "INTEGER", true], ["concept_name", "VARCHAR", true], ["domain_id", "VARCHAR", true], ["vocabulary_id", "VARCHAR", true], ["concept_class_id", "VARCHAR", true], ["standard_concept", "VARCHAR", false], ["concept_code", "VARCHAR", true], ["valid_start_date", "DATE", true], ["valid_end_date", "DATE", true], ["invalid_reason", "VARCHAR", false]], "indexes": []}, "vocabulary": {"columns": [["vocabulary_id", "VARCHAR", true], ["vocabulary_name", "VARCHAR", true], ["vocabulary_reference", "VARCHAR", false], ["vocabulary_version", "VARCHAR", false], ["vocabulary_concept_id", "INTEGER", true]], "indexes": []}, "domain": {"columns": [["domain_id", "VARCHAR", true], ["domain_name", "VARCHAR", true], ["domain_concept_id", "INTEGER", true]], "indexes": []}, "concept_class": {"columns": [["concept_class_id", "VARCHAR", true], ["concept_class_name", "VARCHAR", true], ["concept_class_concept_id", "INTEGER", true]], "indexes": []}, "concept_relationship": {"columns": [["concept_id_1", "INTEGER", true], ["concept_id_2", "INTEGER", true], ["relationship_id", "VARCHAR", true], ["valid_start_date", "DATE", true], ["valid_end_date", "DATE", true], ["invalid_reason", "VARCHAR", false]], "indexes": []}, "relationship": {"columns": [["relationship_id", "VARCHAR", true], ["relationship_name", "VARCHAR", true], ["is_hierarchical", "VARCHAR", true], ["defines_ancestry", "VARCHAR", true], ["reverse_relationship_id", "VARCHAR", true], ["relationship_concept_id", "INTEGER", true]], "indexes": []}, "concept_synonym": {"columns": [["concept_id", "INTEGER", true], ["concept_synonym_name", "VARCHAR", true], ["language_concept_id", "INTEGER", true]], "indexes": []}, "concept_ancestor": {"columns": [["ancestor_concept_id", "INTEGER", true], ["descendant_concept_id", "INTEGER", true], ["min_levels_of_separation", "INTEGER", true], ["max_levels_of_separation", "INTEGER", true]], "indexes": []}, "source_to_concept_map": {"columns": [["source_code", "VARCHAR", true], ["source_concept_id", "INTEGER", true], ["source_vocabulary_id", "VARCHAR", true], ["source_code_description", "VARCHAR", false], ["target_concept_id", "INTEGER", true], ["target_vocabulary_id", "VARCHAR", true], ["valid_start_date", "DATE", true], ["valid_end_date", "DATE", true], ["invalid_reason", "VARCHAR", false]], "indexes": []}, "drug_strength": {"columns": [["drug_concept_id", "INTEGER", true], ["ingredient_concept_id", "INTEGER", true], ["amount_value", "DOUBLE", false], ["amount_unit_concept_id", "INTEGER", false], ["numerator_value", "DOUBLE", false], ["numerator_unit_concept_id", "INTEGER", false], ["denominator_value", "DOUBLE", false], ["denominator_unit_concept_id", "INTEGER", false], ["box_size", "INTEGER", false], ["valid_start_date", "DATE", true], ["valid_end_date", "DATE", true], ["invalid_reason", "VARCHAR", false]], "indexes": []}}, "synthea": {"allergies": {"columns": [["start", "DATE", false], ["stop", "DATE", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["code", "VARCHAR", false], ["system", "VARCHAR", false], ["description", "VARCHAR", false], ["type", "VARCHAR", false], ["category", "VARCHAR", false], ["reaction1", "VARCHAR", false], ["description1", "VARCHAR", false], ["severity1", "VARCHAR", false], ["reaction2", "VARCHAR", false], ["description2", "VARCHAR", false], ["severity2", "VARCHAR", false]], "indexes": []}, "careplans": {"columns": [["id", "VARCHAR", false], ["start", "DATE", false], ["stop", "DATE", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false], ["reasoncode", "VARCHAR", false], ["reasondescription", "VARCHAR", false]], "indexes": []}, "claims": {"columns": [["id", "VARCHAR", false], ["patientid", "VARCHAR", false], ["providerid", "VARCHAR", false], ["primarypatientinsuranceid", "VARCHAR", false], ["secondarypatientinsuranceid", "VARCHAR", false], ["departmentid", "VARCHAR", false], ["patientdepartmentid", "VARCHAR", false], ["diagnosis1", "VARCHAR", false], ["diagnosis2", "VARCHAR", false], ["diagnosis3", "VARCHAR", false], ["diagnosis4", "VARCHAR", false], ["diagnosis5", "VARCHAR", false], ["diagnosis6", "VARCHAR", false], ["diagnosis7", "VARCHAR", false], ["diagnosis8", "VARCHAR", false], ["referringproviderid", "VARCHAR", false], ["appointmentid", "VARCHAR", false], ["currentillnessdate", "TIMESTAMPTZ", false], ["servicedate", "TIMESTAMPTZ", false], ["supervisingproviderid", "VARCHAR", false], ["status1", "VARCHAR", false], ["status2", "VARCHAR", false], ["statusp", "VARCHAR", false], ["outstanding1", "DOUBLE", false], ["outstanding2", "DOUBLE", false], ["outstandingp", "DOUBLE", false], ["lastbilleddate1", "TIMESTAMPTZ", false], ["lastbilleddate2", "TIMESTAMPTZ", false], ["lastbilleddatep", "TIMESTAMPTZ", false], ["healthcareclaimtypeid1", "DOUBLE", false], ["healthcareclaimtypeid2", "DOUBLE", false]], "indexes": []}, "claims_transactions": {"columns": [["id", "VARCHAR", false], ["claimid", "VARCHAR", false], ["chargeid", "DOUBLE", false], ["patientid", "VARCHAR", false], ["type", "VARCHAR", false], ["amount", "DOUBLE", false], ["method", "VARCHAR", false], ["fromdate", "TIMESTAMPTZ", false], ["todate", "TIMESTAMPTZ", false], ["placeofservice", "VARCHAR", false], ["procedurecode", "VARCHAR", false], ["modifier1", "VARCHAR", false], ["modifier2", "VARCHAR", false], ["diagnosisref1", "DOUBLE", false], ["diagnosisref2", "DOUBLE", false], ["diagnosisref3", "DOUBLE", false], ["diagnosisref4", "DOUBLE", false], ["units", "DOUBLE", false], ["departmentid", "DOUBLE", false], ["notes", "VARCHAR", false], ["unitamount", "DOUBLE", false], ["transferoutid", "DOUBLE", false], ["transfertype", "VARCHAR", false], ["payments", "DOUBLE", false], ["adjustments", "DOUBLE", false], ["transfers", "DOUBLE", false], ["outstanding", "DOUBLE", false], ["appointmentid", "VARCHAR", false], ["linenote", "VARCHAR", false], ["patientinsuranceid", "VARCHAR", false], ["feescheduleid", "DOUBLE", false], ["providerid", "VARCHAR", false], ["supervisingproviderid", "VARCHAR", false]], "indexes": []}, "conditions": {"columns": [["start", "DATE", false], ["stop", "DATE", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false]], "indexes": []}, "devices": {"columns": [["start", "TIMESTAMPTZ", false], ["stop", "TIMESTAMPTZ", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false], ["udi", "VARCHAR", false]], "indexes": []}, "encounters": {"columns": [["id", "VARCHAR", false], ["start", "TIMESTAMPTZ", false], ["stop", "TIMESTAMPTZ", false], ["patient", "VARCHAR", false], ["organization", "VARCHAR", false], ["provider", "VARCHAR", false], ["payer", "VARCHAR", false], ["encounterclass", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false], ["base_encounter_cost", "DOUBLE", false], ["total_claim_cost", "DOUBLE", false], ["payer_coverage", "DOUBLE", false], ["reasoncode", "VARCHAR", false], ["reasondescription", "VARCHAR", false]], "indexes": []}, "imaging_studies": {"columns": [["id", "VARCHAR", false], ["date", "TIMESTAMPTZ", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["series_uid", "VARCHAR", false], ["bodysite_code", "VARCHAR", false], ["bodysite_description", "VARCHAR", false], ["modality_code", "VARCHAR", false], ["modality_description", "VARCHAR", false], ["instance_uid", "VARCHAR", false], ["sop_code", "VARCHAR", false], ["sop_description", "VARCHAR", false], ["procedure_code", "VARCHAR", false]], "indexes": []}, "immunizations": {"columns": [["date", "TIMESTAMPTZ", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false], ["base_cost", "DOUBLE", false]], "indexes": []}, "medications": {"columns": [["start", "TIMESTAMPTZ", false], ["stop", "TIMESTAMPTZ", false], ["patient", "VARCHAR", false], ["payer", "VARCHAR", false], ["encounter", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false], ["base_cost", "DOUBLE", false], ["payer_coverage", "DOUBLE", false], ["dispenses", "INTEGER", false], ["totalcost", "DOUBLE", false], ["reasoncode", "VARCHAR", false], ["reasondescription", "VARCHAR", false]], "indexes": []}, "observations": {"columns": [["date", "TIMESTAMPTZ", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["category", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false], ["value", "VARCHAR", false], ["units", "VARCHAR", false], ["type", "VARCHAR", false]], "indexes": []}, "organizations": {"columns": [["id", "VARCHAR", false], ["name", "VARCHAR", false], ["address", "VARCHAR", false], ["city", "VARCHAR", false], ["state", "VARCHAR", false], ["zip", "VARCHAR", false], ["lat", "DOUBLE", false], ["lon", "DOUBLE", false], ["phone", "VARCHAR", false], ["revenue", "DOUBLE", false], ["utilization", "VARCHAR", false]], "indexes": []}, "patients": {"columns": [["id", "VARCHAR", false], ["birthdate", "DATE", false], ["deathdate", "DATE", false], ["ssn", "VARCHAR", false], ["drivers", "VARCHAR", false], ["passport", "VARCHAR", false], ["prefix", "VARCHAR", false], ["first", "VARCHAR", false], ["last", "VARCHAR", false], ["suffix", "VARCHAR", false], ["maiden", "VARCHAR", false], ["marital", "VARCHAR", false], ["race", "VARCHAR", false], ["ethnicity", "VARCHAR", false], ["gender", "VARCHAR", false], ["birthplace", "VARCHAR", false], ["address", "VARCHAR", false], ["city", "VARCHAR", false], ["state", "VARCHAR", false], ["county", "VARCHAR", false], ["zip", "VARCHAR", false], ["lat", "DOUBLE", false], ["lon", "DOUBLE", false], ["healthcare_expenses", "DOUBLE", false], ["healthcare_coverage", "DOUBLE", false]], "indexes": []}, "payer_transitions": {"columns": [["patient", "VARCHAR", false], ["memberid", "VARCHAR", false], ["start_year", "TIMESTAMPTZ", false], ["end_year", "TIMESTAMPTZ", false], ["payer", "VARCHAR", false], ["secondary_payer", "VARCHAR", false], ["ownership", "VARCHAR", false], ["ownername", "VARCHAR", false]], "indexes": []}, "payers": {"columns": [["id", "VARCHAR", false], ["name", "VARCHAR", false], ["address", "VARCHAR", false], ["city", "VARCHAR", false], ["state_headquartered", "VARCHAR", false], ["zip", "VARCHAR", false], ["phone", "VARCHAR", false], ["amount_covered", "DOUBLE", false], ["amount_uncovered", "DOUBLE", false], ["revenue", "DOUBLE", false], ["covered_encounters", "DOUBLE", false], ["uncovered_encounters", "DOUBLE", false], ["covered_medications", "DOUBLE", false], ["uncovered_medications", "DOUBLE", false], ["covered_procedures", "DOUBLE", false], ["uncovered_procedures", "DOUBLE", false], ["covered_immunizations", "DOUBLE", false], ["uncovered_immunizations", "DOUBLE", false], ["unique_customers", "DOUBLE", false], ["qols_avg", "DOUBLE", false], ["member_months", "DOUBLE", false]], "indexes": []}, "procedures": {"columns": [["start", "TIMESTAMPTZ", false], ["stop", "TIMESTAMPTZ", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false], ["base_cost", "DOUBLE", false], ["reasoncode", "VARCHAR", false], ["reasondescription", "VARCHAR", false]], "indexes": []}, "providers": {"columns": [["id", "VARCHAR", false], ["organization", "VARCHAR", false], ["name", "VARCHAR", false], ["gender", "VARCHAR", false], ["speciality", "VARCHAR", false], ["address", "VARCHAR", false], ["city", "VARCHAR", false], ["state", "VARCHAR", false], ["zip", "VARCHAR", false], ["lat", "DOUBLE", false], ["lon", "DOUBLE", false], ["utilization", "DOUBLE", false]], "indexes": []}, "supplies": {"columns": [["date", "DATE", false], ["patient", "VARCHAR", false], ["encounter", "VARCHAR", false], ["code", "VARCHAR", false], ["description", "VARCHAR", false], ["quantity", "DOUBLE", false]], "indexes": []}}}) }}
+{% endmacro %}
@@ -0,0 +1,12 @@
+{#
+  Convert a Synthea timestamp to a naive timestamp in the `dbt_date:time_zone` time zone.
+  With `synthea_normalised: true` the source already holds naive timestamps in that time zone
+  (see csv_to_parquet.py --normalise), so the column is read as is.
+#}
+{% macro synthea_timestamp(column) %}
+  {%- if var("synthea_normalised", false) -%}
+    {{ column }}
+  {%- else -%}
+    {{ timestamptz_to_naive(column) }}
+  {%- endif -%}
+{% endmacro %}
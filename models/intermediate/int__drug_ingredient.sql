@@ -0,0 +1,38 @@
+{#
+  Every drug concept and the RxNorm ingredients it rolls up to, as used by drug_era.
+
+  The roll-up only depends on the vocabulary, so it is incremental. Each row stores a cheap key
+  of the vocabulary it was built from (release and CONCEPT/CONCEPT_ANCESTOR row counts, see
+  drug_ingredient_source_key). Before each run the table is emptied if the key has changed, e.g.
+  after loading a new release, a different prune_vocab subset or an updated vocabulary shard, and
+  it is repopulated only when empty, so the join is only made once per vocabulary. A fingerprint
+  of the rows is stored alongside on each rebuild, to compare builds.
+#}
+{{
+  config(
+    materialized = 'incremental',
+    indexes = [
+      {'columns': ['drug_concept_id']},
+      {'columns': ['ingredient_concept_id']},
+    ],
+    pre_hook = "
+      {% if is_incremental() %}
+      DELETE FROM {{ this }}
+      WHERE vocabulary_key IS DISTINCT FROM ({{ drug_ingredient_source_key() }})
+      {% endif %}
+    ",
+    )
+}}
+WITH cte_drug_ingredient AS (
+    {{ drug_ingredient_rows() }}
+)
+
+SELECT
+    drug_concept_id
+    , ingredient_concept_id
+    , {{ drug_ingredient_source_key() }} AS vocabulary_key
+    , {{ row_set_fingerprint(['drug_concept_id', 'ingredient_concept_id'], 'OVER ()') }} AS vocabulary_fingerprint
+FROM cte_drug_ingredient
+{% if is_incremental() %}
+WHERE NOT EXISTS (SELECT 1 FROM {{ this }})
+{% endif %}
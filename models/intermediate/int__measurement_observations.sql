@@ -6,11 +6,7 @@ SELECT
     , {{ dbt.cast("o.observation_datetime", api.Column.translate_type("time")) }} AS measurement_time
     , 32827 AS measurement_type_concept_id
     , 0 AS operator_concept_id
-    , CASE
-        WHEN {{ regexp_like("o.observation_value", "^[-+]?[0-9]+\.?[0-9]*$") }}
-            THEN {{ dbt.cast("o.observation_value", api.Column.translate_type("decimal")) }}
-        ELSE {{ dbt.cast("null", api.Column.translate_type("decimal")) }}
-    END AS value_as_number
+    , o.observation_value_as_number AS value_as_number
     , coalesce(srcmap2.target_concept_id, 0) AS value_as_concept_id
     , coalesce(srcmap1.target_concept_id, 0) AS unit_concept_id
     , {{ dbt.cast("null", api.Column.translate_type("decimal")) }} AS range_low
@@ -6,7 +6,7 @@ WITH ctePreDrugTarget AS (
     SELECT
         d.drug_exposure_id
         , d.person_id
-        , c.concept_id AS ingredient_concept_id
+        , di.ingredient_concept_id
         , d.drug_exposure_start_date
         , d.days_supply
         , COALESCE(
@@ -18,14 +18,10 @@ WITH ctePreDrugTarget AS (
             , {{ dbt.dateadd("day", 1, "drug_exposure_start_date") }}
         ) AS drug_exposure_end_date
     FROM {{ ref ('drug_exposure') }} AS d
-    INNER JOIN {{ ref ('stg_vocabulary__concept_ancestor') }} AS ca
-        ON d.drug_concept_id = ca.descendant_concept_id
-    INNER JOIN {{ ref ('stg_vocabulary__concept') }} AS c
-        ON ca.ancestor_concept_id = c.concept_id
+    INNER JOIN {{ ref ('int__drug_ingredient') }} AS di
+        ON d.drug_concept_id = di.drug_concept_id
     WHERE
-        c.vocabulary_id = 'RxNorm'
-        AND c.concept_class_id = 'Ingredient'
-        AND d.drug_concept_id != 0
+        d.drug_concept_id != 0
         AND COALESCE(d.days_supply, 0) >= 0
 )
 
@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'claims') ) 
+    get_source_columns('synthea', 'claims') 
 %}
 
 
@@ -36,8 +36,8 @@ WITH cte_claims_lower AS (
         , diagnosis8 AS diagnosis_8
         , referringproviderid AS referring_provider_id
         , appointmentid AS encounter_id
-        , {{ timestamptz_to_naive("currentillnessdate") }} AS current_illness_date
-        , {{ timestamptz_to_naive("servicedate") }} AS service_datetime
+        , {{ synthea_timestamp("currentillnessdate") }} AS current_illness_date
+        , {{ synthea_timestamp("servicedate") }} AS service_datetime
         , supervisingproviderid AS supervising_provider_id
         , status1 AS claim_status_1
         , status2 AS claim_status_2
@@ -45,9 +45,9 @@ WITH cte_claims_lower AS (
         , outstanding1 AS outstanding_1
         , outstanding2 AS outstanding_2
         , outstandingp AS outstanding_patient
-        , {{ timestamptz_to_naive("lastbilleddate1") }} AS last_billed_date_1
-        , {{ timestamptz_to_naive("lastbilleddate2") }} AS last_billed_date_2
-        , {{ timestamptz_to_naive("lastbilleddatep") }} AS last_billed_date_patient
+        , {{ synthea_timestamp("lastbilleddate1") }} AS last_billed_date_1
+        , {{ synthea_timestamp("lastbilleddate2") }} AS last_billed_date_2
+        , {{ synthea_timestamp("lastbilleddatep") }} AS last_billed_date_patient
         , healthcareclaimtypeid1 AS claim_type_id_1
         , healthcareclaimtypeid2 AS claim_type_id_2
     FROM cte_claims_lower
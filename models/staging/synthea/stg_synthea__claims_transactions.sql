@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'claims_transactions') ) 
+    get_source_columns('synthea', 'claims_transactions') 
 %}
 
 
@@ -20,8 +20,8 @@ WITH cte_claims_transactions_lower AS (
         , {{ adapter.quote("type") }} AS transaction_type
         , {{ dbt.cast("amount", api.Column.translate_type("decimal")) }} AS transaction_amount
         , method AS transaction_method
-        , {{ timestamptz_to_naive("fromdate") }} AS transaction_from_date
-        , {{ timestamptz_to_naive("todate") }} AS transaction_to_date
+        , {{ synthea_timestamp("fromdate") }} AS transaction_from_date
+        , {{ synthea_timestamp("todate") }} AS transaction_to_date
         , placeofservice AS place_of_service
         , procedurecode AS procedure_code
         , modifier1 AS procedure_code_modifier_1
@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'devices') ) 
+    get_source_columns('synthea', 'devices') 
 %}
 
 
@@ -13,8 +13,8 @@ WITH cte_devices_lower AS (
 , cte_devices_rename AS (
 
     SELECT
-        {{ timestamptz_to_naive(adapter.quote("start")) }} AS device_start_datetime
-        , {{ timestamptz_to_naive(adapter.quote("stop")) }} AS device_stop_datetime
+        {{ synthea_timestamp(adapter.quote("start")) }} AS device_start_datetime
+        , {{ synthea_timestamp(adapter.quote("stop")) }} AS device_stop_datetime
         , patient AS patient_id
         , encounter AS encounter_id
         , code AS device_code
@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'encounters') ) 
+    get_source_columns('synthea', 'encounters') 
 %}
 
 
@@ -14,11 +14,11 @@ WITH cte_encounters_lower AS (
 
     SELECT
         id AS encounter_id
-        , {{ timestamptz_to_naive(adapter.quote("start")) }} AS encounter_start_datetime
+        , {{ synthea_timestamp(adapter.quote("start")) }} AS encounter_start_datetime
         -- default to start date if stop date is null
         , COALESCE(
-            {{ timestamptz_to_naive(adapter.quote("stop")) }},
-            {{ timestamptz_to_naive(adapter.quote("start")) }}
+            {{ synthea_timestamp(adapter.quote("stop")) }},
+            {{ synthea_timestamp(adapter.quote("start")) }}
         ) AS encounter_stop_datetime
         , patient AS patient_id
         , organization AS organization_id
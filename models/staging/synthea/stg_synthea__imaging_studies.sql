@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'imaging_studies') ) 
+    get_source_columns('synthea', 'imaging_studies') 
 %}
 
 
@@ -14,7 +14,7 @@ WITH cte_imaging_studies_lower AS (
 
     SELECT
         id AS imaging_id
-        , {{ timestamptz_to_naive(adapter.quote("date")) }} AS imaging_datetime
+        , {{ synthea_timestamp(adapter.quote("date")) }} AS imaging_datetime
         , patient AS patient_id
         , encounter AS encounter_id
         , series_uid
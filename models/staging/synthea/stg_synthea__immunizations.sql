@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'immunizations') ) 
+    get_source_columns('synthea', 'immunizations') 
 %}
 
 
@@ -13,7 +13,7 @@ WITH cte_immunizations_lower AS (
 , cte_immunizations_rename AS (
 
     SELECT
-        {{ timestamptz_to_naive(adapter.quote("date")) }} AS immunization_date
+        {{ synthea_timestamp(adapter.quote("date")) }} AS immunization_date
         , patient AS patient_id
         , encounter AS encounter_id
         , code AS immunization_code
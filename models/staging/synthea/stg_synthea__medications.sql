@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'medications') ) 
+    get_source_columns('synthea', 'medications') 
 %}
 
 
@@ -13,8 +13,8 @@ WITH cte_medications_lower AS (
 , cte_medications_rename AS (
 
     SELECT
-        {{ timestamptz_to_naive(adapter.quote("start")) }} AS medication_start_datetime
-        , {{ timestamptz_to_naive(adapter.quote("stop")) }} AS medication_stop_datetime
+        {{ synthea_timestamp(adapter.quote("start")) }} AS medication_start_datetime
+        , {{ synthea_timestamp(adapter.quote("stop")) }} AS medication_stop_datetime
         , patient AS patient_id
         , payer AS payer_id
         , encounter AS encounter_id
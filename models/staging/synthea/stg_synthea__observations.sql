@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'observations') ) 
+    get_source_columns('synthea', 'observations') 
 %}
 
 
@@ -13,13 +13,22 @@ WITH cte_observations_lower AS (
 , cte_observations_rename AS (
 
     SELECT
-        {{ timestamptz_to_naive(adapter.quote("date")) }} AS observation_datetime
+        {{ synthea_timestamp(adapter.quote("date")) }} AS observation_datetime
         , patient AS patient_id
         , encounter AS encounter_id
         , category AS observation_category
         , code AS observation_code
         , description AS observation_description
         , {{ adapter.quote("value") }} AS observation_value
+        {% if var("synthea_normalised", false) -%}
+        , value_numeric AS observation_value_as_number
+        {%- else -%}
+        , CASE
+            WHEN {{ regexp_like(adapter.quote("value"), "^[-+]?[0-9]+\.?[0-9]*$") }}
+                THEN {{ dbt.cast(adapter.quote("value"), api.Column.translate_type("decimal")) }}
+            ELSE {{ dbt.cast("null", api.Column.translate_type("decimal")) }}
+        END AS observation_value_as_number
+        {%- endif %}
         , units AS observation_units
         , {{ adapter.quote("type") }} AS observation_value_type
     FROM cte_observations_lower
@@ -37,6 +46,7 @@ WITH cte_observations_lower AS (
         , observation_code
         , observation_description
         , observation_value
+        , observation_value_as_number
         , observation_units
         , observation_value_type
     FROM cte_observations_rename
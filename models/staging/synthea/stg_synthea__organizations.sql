@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'organizations') ) 
+    get_source_columns('synthea', 'organizations') 
 %}
 
 
@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('synthea', 'payer_transitions') ) 
+    get_source_columns('synthea', 'payer_transitions') 
 %}
 
 
@@ -15,8 +15,8 @@ WITH cte_payer_transitions_lower AS (
     SELECT
         patient AS patient_id
         , memberid AS member_id
-        , {{ timestamptz_to_naive("start_year") }} AS coverage_start_datetime
-        , {{ timestamptz_to_naive("end_year") }} AS coverage_end_datetime
+        , {{ synthea_timestamp("start_year") }} AS coverage_start_datetime
+        , {{ synthea_timestamp("end_year") }} AS coverage_end_datetime
         , payer AS payer_id
         , secondary_payer AS secondary_payer_id
         , ownership AS plan_owner_relationship
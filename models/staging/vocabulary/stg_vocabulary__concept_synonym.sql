@@ -1,5 +1,5 @@
 {% set column_names = 
-    dbt_utils.get_filtered_columns_in_relation( source('vocabulary', 'concept_synonym') ) 
+    get_source_columns('vocabulary', 'concept_synonym') 
 %}
 
 
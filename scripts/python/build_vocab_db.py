@@ -0,0 +1,132 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["duckdb<=1.3"]
+# ///
+
+"""
+Build a standalone, read-only DuckDB vocabulary database from Athena csv or parquet files.
+
+The database can be shared by any number of dbt-synthea environments (developers, CI jobs) on
+the same machine: attach it read-only in profiles.yml and set the vocab_catalog dbt variable,
+instead of loading the vocabulary into every target schema. See the README for details.
+
+Tables are written to the main schema with the column types from the schema catalogue, and the
+large tables are sorted on the columns the ETL joins on, so DuckDB's zonemaps can skip most
+row groups. Catalogued vocabulary tables missing from the input are created empty.
+
+The database is built next to the output path and moved into place once complete, so runs
+already reading a previous build are not disturbed.
+"""
+
+import argparse
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+from duckdb import DuckDBPyConnection
+
+from schema_catalog import SchemaCatalog, TableSpec, load_catalog, render_create_table
+
+# Sort keys for the large vocabulary tables, matching the joins the ETL makes.
+sort_keys: dict[str, list[str]] = {
+    "concept": ["concept_id"],
+    "concept_relationship": ["concept_id_1", "concept_id_2"],
+    "concept_ancestor": ["descendant_concept_id", "ancestor_concept_id"],
+    "concept_synonym": ["concept_id"],
+    "drug_strength": ["drug_concept_id"],
+}
+
+
+@dataclass
+class CliArgs:
+    """A dataclass to ensure correct typing of command line arguments"""
+
+    input_directory: Path = Path()
+    output_path: Path = Path()
+
+
+def parse_cli_arguments() -> CliArgs:
+    """Parse command line arguments."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="""Build a read-only DuckDB vocabulary database from Athena csv or parquet files."""
+    )
+    _ = parser.add_argument(
+        "input_directory",
+        type=Path,
+        help="Path to the directory of vocabulary files, e.g. the Athena download.",
+    )
+    _ = parser.add_argument(
+        "output_path",
+        type=Path,
+        help="Path of the DuckDB file to build, e.g. vocab.duckdb. Replaced if it exists.",
+    )
+
+    args: CliArgs = parser.parse_args(namespace=CliArgs())
+
+    input_dir: Path = args.input_directory.resolve()
+    if input_dir.exists():
+        args.input_directory = input_dir
+    else:
+        parser.exit(1, f"{args.input_directory} does not exist.")
+    args.output_path = args.output_path.resolve()
+
+    return args
+
+
+def read_source_sql(file_path: Path, table_spec: TableSpec | None) -> str:
+    """Return a SELECT reading the file, with catalogue types for csv files where available."""
+    if file_path.suffix == ".parquet":
+        return f"SELECT * FROM read_parquet('{file_path}')"
+    if table_spec is None:
+        return f"SELECT * FROM read_csv('{file_path}', quote = '')"
+    column_types: str = ", ".join(
+        f"'{name}': '{data_type}'"
+        for name, data_type in table_spec.column_types("duckdb").items()
+    )
+    return (
+        f"SELECT * FROM read_csv('{file_path}', quote = '', header = true, "
+        + f"dateformat = '%Y%m%d', columns = {{{column_types}}})"
+    )
+
+
+def build_vocab_db(input_directory: Path, output_path: Path) -> None:
+    """Load every vocabulary file into a new DuckDB database at output_path."""
+    catalog: SchemaCatalog = load_catalog()
+    file_dict: dict[str, Path] = {
+        file.stem.lower(): file
+        for file in sorted(input_directory.iterdir())
+        if file.suffix in {".csv", ".parquet"}
+    }
+    if not file_dict:
+        raise FileNotFoundError(f"No csv or parquet files found in {input_directory}.")
+
+    build_path: Path = output_path.with_name(f".{output_path.name}.building")
+    build_path.unlink(missing_ok=True)
+    conn: DuckDBPyConnection = duckdb.connect(str(build_path))
+
+    for table, file_path in file_dict.items():
+        print(f" Loading {table}")
+        source_sql: str = read_source_sql(file_path, catalog.table("vocabulary", table))
+        order_by: str = (
+            f" ORDER BY {', '.join(sort_keys[table])}" if table in sort_keys else ""
+        )
+        _ = conn.execute(f"CREATE TABLE main.{table} AS {source_sql}{order_by}")
+
+    # Create the remaining catalogued tables so every vocabulary source resolves.
+    for table_spec in catalog.tables("vocabulary"):
+        if table_spec.name not in file_dict:
+            _ = conn.execute(render_create_table(table_spec, "main", "duckdb"))
+
+    _ = conn.execute("ANALYZE")
+    _ = conn.execute("CHECKPOINT")
+    conn.close()
+    os.replace(build_path, output_path)
+
+
+if __name__ == "__main__":
+    args: CliArgs = parse_cli_arguments()
+    build_vocab_db(args.input_directory, args.output_path)
+    print(f" Exported to `{args.output_path}`")
+    print("  Done!")
@@ -7,7 +7,15 @@
 """
 Script to convert Synthea or Athena-Vocab csv files to parquet for use with dbt-synthea.
 
-Specific columns will be cast to the correct type ready for use.
+Column types are taken from the schema catalogue (see schema_catalog.py), so catalogued tables
+are read without csv type sniffing and every column is written with the correct type.
+Files that are not in the catalogue are converted using the sniffed types.
+
+Pass --normalise when converting Synthea files to do per-row work once, at conversion time:
+ - timestamps are written as naive timestamps in the given time zone (--time-zone, UTC by default),
+   which must match the dbt_date:time_zone variable.
+ - observations gain a value_numeric column holding VALUE as a number where it is numeric.
+Then set the synthea_normalised variable to true so staging reads these columns as they are.
 
 Set to convert Synthea files by default, if converting vocab files then pass the -v or --vocab flags.
 
@@ -20,9 +28,11 @@ from pathlib import Path
 
 import duckdb
 from duckdb import DuckDBPyConnection, DuckDBPyRelation
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import argparse
 
+from schema_catalog import SchemaCatalog, TableSpec, load_catalog
+
 
 @dataclass
 class CliArgs:
@@ -31,6 +41,12 @@ class CliArgs:
     input_directory: Path = Path()
     vocab: bool = False
     output_dir: Path | None = None
+    normalise: bool = False
+    time_zone: str = "UTC"
+
+
+# Matches the numeric check staging applies to observation values when not normalised.
+numeric_value_pattern: str = r"^[-+]?[0-9]+\.?[0-9]*$"
 
 
 @dataclass
@@ -38,9 +54,7 @@ class BaseInfo:
     """Base class for Info dataclasses."""
 
     output_dir_name: str
-    table_cast_list: list[str]
-    column_cast_list: list[str]
-    new_type: str
+    catalog_group: str
     date_format: str
 
 
@@ -49,17 +63,7 @@ class VocabInfo(BaseInfo):
     """Dataclass to store info for Vocab -> parquet conversion."""
 
     output_dir_name: str = "vocab_parquet"
-    table_cast_list: list[str] = field(
-        default_factory=lambda: [
-            "concept",
-            "concept_relationship",
-            "drug_strength",
-        ]
-    )
-    column_cast_list: list[str] = field(
-        default_factory=lambda: ["valid_start_date", "valid_end_date"]
-    )
-    new_type: str = "DATE"
+    catalog_group: str = "vocabulary"
     date_format: str = "%Y%m%d"
 
 
@@ -68,17 +72,7 @@ class SyntheaInfo(BaseInfo):
     """Dataclass to store info for Synthea -> parquet conversion."""
 
     output_dir_name: str = "synthea_parquet"
-    table_cast_list: list[str] = field(
-        default_factory=lambda: [
-            "medications",
-            "allergies",
-            "conditions",
-            "devices",
-            "procedures",
-        ]
-    )
-    column_cast_list: list[str] = field(default_factory=lambda: ["CODE"])
-    new_type: str = "VARCHAR"
+    catalog_group: str = "synthea"
     date_format: str = "%Y-%m-%d"
 
 
@@ -109,6 +103,7 @@ def parse_cli_arguments() -> CliArgs:
     _ = parser.add_argument(
         "--output",
         "-o",
+        dest="output_dir",
         type=Path,
         help="""Optional output directory.
         If not passed then an output directory will be created in the same directory as the input directory.
@@ -116,6 +111,22 @@ def parse_cli_arguments() -> CliArgs:
         """,
     )
 
+    _ = parser.add_argument(
+        "--normalise",
+        "-n",
+        action="store_true",
+        help="""Write naive timestamps in --time-zone and typed observation values.
+        Set the synthea_normalised dbt variable to true when using the output.
+        """,
+    )
+    _ = parser.add_argument(
+        "--time-zone",
+        "-tz",
+        dest="time_zone",
+        type=str,
+        help="Time zone of the naive timestamps written by --normalise. Must match dbt_date:time_zone. Defaults to UTC.",
+    )
+
     # Store paths in CLIArgs data class.
     args: CliArgs = parser.parse_args(namespace=CliArgs())
 
@@ -128,22 +139,10 @@ def parse_cli_arguments() -> CliArgs:
     if args.output_dir:
         args.output_dir = args.output_dir.resolve()
 
-    return args
+    if args.normalise and args.vocab:
+        parser.exit(1, "--normalise only applies to Synthea files.")
 
-
-def get_column_type_dict(conn: DuckDBPyConnection, file_path: Path) -> dict[str, str]:
-    """Create a dictionary of columns and their types for the given CSV file."""
-    csv_file: DuckDBPyRelation = conn.read_csv(str(file_path))
-    columns: list[str] = csv_file.columns
-    types: list[str] = [str(type) for type in csv_file.types]
-    column_type_dict: dict[str, str] = dict(zip(columns, types))
-    return column_type_dict
-
-
-def alter_type_dict(column_dict: dict[str, str], alter_list: list[str], new_type: str):
-    """Alter the data types of the specified columns in the column dict"""
-    for column in alter_list:
-        column_dict[column] = new_type
+    return args
 
 
 def create_relation(
@@ -152,15 +151,38 @@ def create_relation(
     file_path: Path,
     date_format: str,
 ) -> DuckDBPyRelation:
-    """Create a DuckDBPyRelation of the target csv file using using the specified date format."""
+    """Create a DuckDBPyRelation of the target csv file using the given column types and date format."""
     relation: DuckDBPyRelation = conn.read_csv(
-        str(file_path), columns=table_dict, date_format=date_format
+        str(file_path), header=True, columns=table_dict, date_format=date_format
     )
     return relation
 
 
+def normalise_relation(
+    relation: DuckDBPyRelation, table_spec: TableSpec, time_zone: str
+) -> DuckDBPyRelation:
+    """Convert timestamps to naive timestamps in time_zone, and type observation values."""
+    projections: list[str] = []
+    for column in table_spec.columns:
+        quoted: str = f'"{column.name}"'
+        if column.datatype == "timestamptz":
+            projections.append(f"timezone('{time_zone}', {quoted}) AS {quoted}")
+        else:
+            projections.append(quoted)
+    if table_spec.name == "observations":
+        projections.append(
+            f"""CASE WHEN regexp_full_match("value", '{numeric_value_pattern}')
+            THEN CAST("value" AS DECIMAL(18, 3)) END AS value_numeric"""
+        )
+    return relation.project(", ".join(projections))
+
+
 def convert_to_parquet(
-    input_directory: Path, vocab: bool = False, output_dir: Path | None = None
+    input_directory: Path,
+    vocab: bool = False,
+    output_dir: Path | None = None,
+    normalise: bool = False,
+    time_zone: str = "UTC",
 ) -> None:
     """Main function for the vocab_to_parquet script"""
 
@@ -187,30 +209,32 @@ def convert_to_parquet(
         output_directory = input_directory.with_name(info.output_dir_name)
     output_directory.mkdir(exist_ok=True, parents=True)
 
-    # Process tables that need to be altered.
-    for table in info.table_cast_list:
-        # Initialize file path and output path.
-        file_path: Path = file_dict.pop(table)
+    catalog: SchemaCatalog = load_catalog()
+
+    for table, file_path in file_dict.items():
         output_path: Path = (
             output_directory / file_path.with_suffix(".parquet").name.lower()
         )
-
-        # Create the file column dictionary and alter the specified columns.
-        column_type_dict: dict[str, str] = get_column_type_dict(conn, file_path)
-        alter_type_dict(column_type_dict, info.column_cast_list, info.new_type)
-
-        # Create relation and convert to parquet.
-        rel: DuckDBPyRelation = create_relation(
-            conn, column_type_dict, file_path, info.date_format
-        )
+        table_spec: TableSpec | None = catalog.table(info.catalog_group, table)
+
+        # Read catalogued tables with explicit types, anything else is sniffed.
+        if table_spec:
+            rel: DuckDBPyRelation = create_relation(
+                conn, table_spec.column_types("duckdb"), file_path, info.date_format
+            )
+            if normalise:
+                rel = normalise_relation(rel, table_spec, time_zone)
+        else:
+            rel = conn.read_csv(str(file_path))
         _ = rel.to_parquet(str(output_path))
 
-    # Process the remaining files.
-    for file_path in file_dict.values():
-        output_path = output_directory / file_path.with_suffix(".parquet").name.lower()
-        _ = conn.read_csv(str(file_path)).to_parquet(str(output_path))
-
 
 if __name__ == "__main__":
     args: CliArgs = parse_cli_arguments()
-    convert_to_parquet(args.input_directory, args.vocab, args.output_dir)
+    convert_to_parquet(
+        args.input_directory,
+        args.vocab,
+        args.output_dir,
+        args.normalise,
+        args.time_zone,
+    )
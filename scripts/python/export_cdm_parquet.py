@@ -0,0 +1,368 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["duckdb<=1.3"]
+# ///
+
+"""
+Export the OMOP CDM tables from a DuckDB database to zstd compressed parquet, in parallel.
+
+Tables with a person_id column and at least --bucket-min-rows rows are split into
+--buckets hive partitions on person_id % buckets, e.g. measurement/person_bucket=3/measurement_0.parquet,
+with a single partitioned COPY, so the source table is scanned once. Every person level table is
+sorted by (person_id, first date column). Other tables are written to a single file sorted by
+their primary key. Tables are exported concurrently, --jobs at a time.
+
+A manifest.json in the output directory records the row count and sha256 of every file,
+and the row count of every source table. Each table is written under a temporary name and
+recorded in the manifest once complete, so an interrupted export can be resumed by
+running the same command again: tables already in the manifest are skipped. Resuming with a
+different --schema, --buckets or --bucket-min-rows is refused. If a table has grown past
+--bucket-min-rows since the last run, the files of its old layout are removed.
+
+Example:
+python3 scripts/python/export_cdm_parquet.py synthea_omop_etl.duckdb ./omop_parquet --schema dbt_synthea_dev
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import duckdb
+from duckdb import DuckDBPyConnection
+
+from schema_catalog import SchemaCatalog, TableSpec, load_catalog
+
+manifest_name: str = "manifest.json"
+
+
+@dataclass
+class CliArgs:
+    """A dataclass to ensure correct typing of command line arguments"""
+
+    db_file: Path = Path()
+    output_dir: Path = Path()
+    schema: str = "dbt_synthea_dev"
+    buckets: int = 16
+    bucket_min_rows: int = 1_000_000
+    jobs: int = 4
+    tables: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ExportTable:
+    """A table to export: to a single file, or to one file per person_id bucket."""
+
+    table: str
+    source_rows: int
+    select_sql: str
+    bucketed: bool
+
+
+def parse_cli_arguments() -> CliArgs:
+    """Parse command line arguments."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="""Export the OMOP CDM tables from a DuckDB database to partitioned zstd parquet."""
+    )
+    _ = parser.add_argument("db_file", type=Path, help="Path to the DuckDB database.")
+    _ = parser.add_argument(
+        "output_dir", type=Path, help="Path to the output directory."
+    )
+    _ = parser.add_argument(
+        "--schema",
+        "-s",
+        type=str,
+        help="Schema holding the OMOP tables. Defaults to dbt_synthea_dev.",
+    )
+    _ = parser.add_argument(
+        "--buckets",
+        "-b",
+        type=int,
+        help="Number of person_id buckets for large person level tables. Defaults to 16.",
+    )
+    _ = parser.add_argument(
+        "--bucket-min-rows",
+        dest="bucket_min_rows",
+        type=int,
+        help="Person level tables with fewer rows are written to one file. Defaults to 1,000,000.",
+    )
+    _ = parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Number of tables written concurrently. Defaults to 4.",
+    )
+    _ = parser.add_argument(
+        "--tables",
+        "-t",
+        nargs="+",
+        help="Optional subset of tables to export. Defaults to every OMOP table in the schema.",
+    )
+
+    args: CliArgs = parser.parse_args(namespace=CliArgs())
+    args.db_file = args.db_file.resolve()
+    if not args.db_file.is_file():
+        parser.exit(1, f"Source database does not exist: {args.db_file}")
+    args.output_dir = args.output_dir.resolve()
+    if args.buckets < 1:
+        parser.exit(1, "--buckets must be at least 1.")
+
+    manifest_path: Path = args.output_dir / manifest_name
+    if manifest_path.exists():
+        manifest: dict[str, object] = json.loads(manifest_path.read_text())
+        if (
+            manifest["schema"],
+            manifest["buckets"],
+            manifest.get("bucket_min_rows"),
+        ) != (
+            args.schema,
+            args.buckets,
+            args.bucket_min_rows,
+        ):
+            parser.exit(
+                1,
+                f"{args.output_dir} holds an export of schema {manifest['schema']} with "
+                + f"{manifest['buckets']} buckets and --bucket-min-rows {manifest.get('bucket_min_rows')}. "
+                + "Use the same options to resume it, or a new output directory.",
+            )
+    return args
+
+
+def plan_table(
+    conn: DuckDBPyConnection,
+    schema: str,
+    table_spec: TableSpec,
+    buckets: int,
+    bucket_min_rows: int,
+) -> ExportTable:
+    """Return how to export a table, with its source row count."""
+    source_rows: int = conn.execute(
+        f"SELECT count(*) FROM {schema}.{table_spec.name}"
+    ).fetchone()[
+        0
+    ]  # pyright: ignore[reportOptionalSubscript]
+    column_names: list[str] = [column.name for column in table_spec.columns]
+    table: str = table_spec.name
+
+    if "person_id" in column_names:
+        date_columns: list[str] = [
+            column.name
+            for column in table_spec.columns
+            if column.datatype.lower() == "date"
+        ]
+        order_by: list[str] = ["person_id", *date_columns[:1]]
+    else:
+        order_by = [column.name for column in table_spec.columns if column.primary_key]
+    order_sql: str = f" ORDER BY {', '.join(order_by)}" if order_by else ""
+
+    if "person_id" in column_names and source_rows >= bucket_min_rows and buckets > 1:
+        return ExportTable(
+            table=table,
+            source_rows=source_rows,
+            select_sql=f"SELECT *, person_id % {buckets} AS person_bucket FROM {schema}.{table}{order_sql}",
+            bucketed=True,
+        )
+    return ExportTable(
+        table=table,
+        source_rows=source_rows,
+        select_sql=f"SELECT * FROM {schema}.{table}{order_sql}",
+        bucketed=False,
+    )
+
+
+def file_sha256(path: Path) -> str:
+    """Return the sha256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_entry(cursor: DuckDBPyConnection, path: Path) -> dict[str, object]:
+    """Return the manifest entry of a written parquet file: its row count and sha256."""
+    rows: int = cursor.execute(
+        f"SELECT coalesce(sum(num_rows), 0) FROM parquet_file_metadata('{path}')"
+    ).fetchone()[
+        0
+    ]  # pyright: ignore[reportOptionalSubscript]
+    return {"rows": rows, "sha256": file_sha256(path)}
+
+
+def export_table(
+    conn: DuckDBPyConnection, output_dir: Path, export: ExportTable
+) -> dict[str, dict[str, object]]:
+    """Write a table on its own cursor and return the manifest entries of its files."""
+    cursor: DuckDBPyConnection = conn.cursor()
+    table_dir: Path = output_dir / export.table
+    entries: dict[str, dict[str, object]] = {}
+
+    if export.bucketed:
+        # One scan of the source writes every bucket, then the directory is swapped into place.
+        temporary_dir: Path = output_dir / f".{export.table}.tmp"
+        shutil.rmtree(temporary_dir, ignore_errors=True)
+        _ = cursor.execute(
+            f"COPY ({export.select_sql}) TO '{temporary_dir}' (FORMAT parquet, COMPRESSION zstd, "
+            + f"PARTITION_BY (person_bucket), FILENAME_PATTERN '{export.table}_{{i}}')"
+        )
+        for path in sorted(temporary_dir.rglob("*.parquet")):
+            relative_path: Path = path.relative_to(temporary_dir)
+            entries[f"{export.table}/{relative_path.as_posix()}"] = file_entry(
+                cursor, path
+            )
+        shutil.rmtree(table_dir, ignore_errors=True)
+        os.replace(temporary_dir, table_dir)
+    else:
+        output_path: Path = table_dir / f"{export.table}.parquet"
+        table_dir.mkdir(parents=True, exist_ok=True)
+        temporary_path: Path = output_path.with_name(f".{output_path.name}.tmp")
+        _ = cursor.execute(
+            f"COPY ({export.select_sql}) TO '{temporary_path}' (FORMAT parquet, COMPRESSION zstd)"
+        )
+        entry: dict[str, object] = file_entry(cursor, temporary_path)
+        os.replace(temporary_path, output_path)
+        entries[f"{export.table}/{output_path.name}"] = entry
+    cursor.close()
+    return entries
+
+
+def write_manifest(output_dir: Path, manifest: dict[str, object]) -> None:
+    """Write the manifest atomically, so an interrupted export always leaves a valid one."""
+    temporary_path: Path = output_dir / f".{manifest_name}.tmp"
+    _ = temporary_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(temporary_path, output_dir / manifest_name)
+
+
+def main(args: CliArgs) -> int:
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path: Path = args.output_dir / manifest_name
+    manifest: dict[str, object] = (
+        json.loads(manifest_path.read_text())
+        if manifest_path.exists()
+        else {
+            "schema": args.schema,
+            "buckets": args.buckets,
+            "bucket_min_rows": args.bucket_min_rows,
+            "tables": {},
+            "files": {},
+        }
+    )
+    tables_manifest: dict[str, dict[str, object]] = manifest[
+        "tables"
+    ]  # pyright: ignore[reportAssignmentType]
+    files_manifest: dict[str, dict[str, object]] = manifest[
+        "files"
+    ]  # pyright: ignore[reportAssignmentType]
+
+    conn: DuckDBPyConnection = duckdb.connect(str(args.db_file), read_only=True)
+    existing_tables: set[str] = {
+        name
+        for (name,) in conn.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_schema = ?",
+            [args.schema],
+        ).fetchall()
+    }
+    catalog: SchemaCatalog = load_catalog()
+    table_specs: list[TableSpec] = [
+        table_spec
+        for table_spec in catalog.tables("cdm")
+        if table_spec.name in existing_tables
+        and (not args.tables or table_spec.name in args.tables)
+    ]
+
+    # Plan every table, skipping those completed by a previous run with the same layout.
+    pending: list[ExportTable] = []
+    for table_spec in table_specs:
+        export: ExportTable = plan_table(
+            conn, args.schema, table_spec, args.buckets, args.bucket_min_rows
+        )
+        previous: dict[str, object] = tables_manifest.get(export.table, {})
+        previous_files: list[str] = previous.get(
+            "files", []
+        )  # pyright: ignore[reportAssignmentType]
+        if (
+            previous.get("complete")
+            and previous.get("bucketed") == export.bucketed
+            and all(
+                path in files_manifest and (args.output_dir / path).exists()
+                for path in previous_files
+            )
+        ):
+            tables_manifest[export.table]["source_rows"] = export.source_rows
+            continue
+        tables_manifest[export.table] = {
+            "source_rows": export.source_rows,
+            "bucketed": export.bucketed,
+            "complete": False,
+            "files": [],
+        }
+        pending.append(export)
+
+    # Remove the files of tables being re-exported. A table that crossed --bucket-min-rows since
+    # the last run changes layout, and its old files would make a `table/**/*.parquet` read
+    # count its rows twice.
+    planned_paths: set[str] = {
+        path
+        for table_manifest in tables_manifest.values()
+        for path in table_manifest["files"]  # pyright: ignore[reportGeneralTypeIssues]
+    }
+    for stale_path in sorted(set(files_manifest) - planned_paths):
+        stale_file: Path = args.output_dir / stale_path
+        stale_file.unlink(missing_ok=True)
+        if stale_file.parent.is_dir() and not any(stale_file.parent.iterdir()):
+            stale_file.parent.rmdir()
+        del files_manifest[stale_path]
+        print(f" Removed stale file {stale_path}")
+    write_manifest(args.output_dir, manifest)
+    print(f" Exporting {len(pending)} of {len(table_specs)} table(s)")
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures: dict[Future[dict[str, dict[str, object]]], ExportTable] = {
+            executor.submit(export_table, conn, args.output_dir, export): export
+            for export in pending
+        }
+        for future in as_completed(futures):
+            export = futures[future]
+            entries: dict[str, dict[str, object]] = future.result()
+            files_manifest.update(entries)
+            tables_manifest[export.table] |= {
+                "complete": True,
+                "files": sorted(entries),
+            }
+            write_manifest(args.output_dir, manifest)
+            print(
+                f"Table '{export.table}' exported to {len(entries)} file(s) in {export.table}/"
+            )
+    conn.close()
+
+    # Check the exported row counts against the source tables.
+    mismatches: list[str] = []
+    for table, table_manifest in tables_manifest.items():
+        exported_rows: int = sum(
+            files_manifest[path]["rows"]  # pyright: ignore[reportArgumentType]
+            for path in table_manifest[
+                "files"
+            ]  # pyright: ignore[reportGeneralTypeIssues]
+        )
+        if exported_rows != table_manifest["source_rows"]:
+            mismatches.append(
+                f"{table}: {exported_rows} rows exported, {table_manifest['source_rows']} in source"
+            )
+    for mismatch in mismatches:
+        print(f" Row count mismatch for {mismatch}")
+    if mismatches:
+        return 1
+
+    print(f" Exported all to `{args.output_dir}`")
+    print("  Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_cli_arguments()))
@@ -1,7 +1,7 @@
 #!/usr/bin/env  -S uv run --script
 # /// script
 # requires-python = ">=3.12"
-# dependencies = [ "beautifulsoup4", "ruamel-yaml", "requests" ]
+# dependencies = [ "beautifulsoup4", "lxml", "ruamel-yaml", "requests" ]
 # ///
 
 """
@@ -19,10 +19,26 @@ https://raw.githubusercontent.com/OHDSI/CommonDataModel/refs/heads/main/docs/cdm
 If you wish to use a different version, either pass the url in as the --source argument
 or download the html file and pass the path in as --source.
 For example using wget <url>.
+
+Downloaded documentation is cached in --cache-dir (default ~/.cache/dbt-synthea) keyed by
+url, and revalidated against the server ETag on each run. Pass --offline to only use the
+cached copy, e.g. in CI.
+
+The parsed documentation can be saved to the schema catalogue with --catalog, and the
+catalogue can be used as --source instead of the html, see schema_catalog.py.
+
+Pass --check to compare the generated YAML with the files already in the output directory
+without writing anything. The script exits with status 1 if any file would change.
+For example:
+./generate_dbt_yaml.py models/omop/_models --check --offline
 """
 
 import argparse
-import tempfile
+import difflib
+import hashlib
+import io
+import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import ParseResult, urlparse
@@ -33,22 +49,17 @@ from bs4._typing import _AtMostOneElement  # pyright: ignore[reportPrivateUsage]
 from bs4.element import NavigableString, Tag
 from ruamel.yaml import YAML
 
-default_source_url = "https://raw.githubusercontent.com/OHDSI/CommonDataModel/refs/heads/main/docs/cdm54.html"
-
+from schema_catalog import (
+    ColumnSpec,
+    SchemaCatalog,
+    TableSpec,
+    load_catalog,
+    save_catalog,
+)
 
-@dataclass
-class OmopDocumentationContainer:
-    """Object to store how the CDM docs express each column"""
-
-    cdm_field: str
-    user_guide: str
-    etl_conventions: str
-    datatype: str
-    required: bool
-    primary_key: bool
-    foreign_key: bool
-    foreign_key_table: str
-    foreign_key_domain: str
+default_source_url = "https://raw.githubusercontent.com/OHDSI/CommonDataModel/refs/heads/main/docs/cdm54.html"
+default_cache_dir = Path.home() / ".cache" / "dbt-synthea"
+parser_backends: list[str] = ["html.parser", "lxml"]
 
 
 @dataclass
@@ -58,6 +69,11 @@ class CliArgs:
     output_dir: Path = Path()
     source: str = default_source_url
     overwrite: bool = False
+    cache_dir: Path = default_cache_dir
+    offline: bool = False
+    parser: str = "html.parser"
+    check: bool = False
+    catalog: Path | None = None
 
 
 def is_url(value: str) -> bool:
@@ -66,24 +82,75 @@ def is_url(value: str) -> bool:
     return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
 
 
-def download_url_to_temp_file(url: str, output_dir: Path) -> Path:
-    """Download a URL to a .tmp file in the output directory and return the local Path."""
-    response = requests.get(url)
-    response.raise_for_status()  # raises if e.g. 404 or timeout
+def cached_source_paths(url: str, cache_dir: Path) -> tuple[Path, Path]:
+    """Return the cached html path and its metadata path for a url."""
+    url_key: str = hashlib.sha256(url.encode()).hexdigest()[:16]
+    stem: str = Path(urlparse(url).path).stem or "cdm"
+    return (
+        cache_dir / f"{stem}-{url_key}.html",
+        cache_dir / f"{stem}-{url_key}.json",
+    )
 
-    with tempfile.NamedTemporaryFile(
-        delete=False, dir=output_dir, suffix=".tmp"
-    ) as tmp_file:
-        _ = tmp_file.write(response.content)
-        return Path(tmp_file.name)
 
+def fetch_cached_source(url: str, cache_dir: Path, offline: bool = False) -> Path:
+    """
+    Return a local copy of the url, downloading it only if the cached copy is stale.
 
-def parse_cli_arguments() -> tuple[Path, Path]:
+    The cached copy is revalidated with the ETag/Last-Modified headers recorded when it
+    was downloaded, so an unchanged document costs a single 304 response. If the server
+    cannot be reached, or offline is True, the cached copy is used as is.
+    """
+    html_path, meta_path = cached_source_paths(url, cache_dir)
+    metadata: dict[str, str] = {}
+    if html_path.exists() and meta_path.exists():
+        metadata = json.loads(meta_path.read_text())
+
+    if offline:
+        if not html_path.exists():
+            raise FileNotFoundError(
+                f"No cached copy of {url} in {cache_dir}. Run once without --offline."
+            )
+        return html_path
+
+    headers: dict[str, str] = {}
+    if metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+
+    try:
+        response = requests.get(url, headers=headers, timeout=30)
+        response.raise_for_status()  # raises if e.g. 404
+    except requests.RequestException as e:
+        if html_path.exists():
+            print(f" Could not reach {url} ({e}), using cached copy {html_path}")
+            return html_path
+        raise
+
+    if response.status_code == 304:
+        return html_path
+
+    # Write to a temporary file first so an interrupted download never leaves a partial cache.
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path = html_path.with_suffix(".tmp")
+    _ = tmp_path.write_bytes(response.content)
+    _ = tmp_path.replace(html_path)
+    metadata = {
+        "url": url,
+        "etag": response.headers.get("ETag", ""),
+        "last_modified": response.headers.get("Last-Modified", ""),
+        "sha256": hashlib.sha256(response.content).hexdigest(),
+    }
+    _ = meta_path.write_text(json.dumps(metadata, indent=2))
+    return html_path
+
+
+def parse_cli_arguments() -> tuple[Path, CliArgs]:
     """
     Parse command line arguments.
 
     Returns:
-         CLIArgs DataClass containing cdm_html: str and output_dir: Path().
+         Path to the local source html and the CLIArgs DataClass.
     """
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
         description="""
@@ -102,7 +169,7 @@ def parse_cli_arguments() -> tuple[Path, Path]:
         "--source",
         "-s",
         type=str,
-        help=f'Path or url to source html. If none provided defaults to:\n"{default_source_url}"',
+        help=f'Path or url to source html, or path to a schema catalogue json. If none provided defaults to:\n"{default_source_url}"',
     )
 
     _ = parser.add_argument(
@@ -113,20 +180,60 @@ def parse_cli_arguments() -> tuple[Path, Path]:
         If not passed then the script will abort if the output directory contains ANY yaml files.""",
     )
 
+    _ = parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        type=Path,
+        help=f"Directory used to cache downloaded documentation. Defaults to {default_cache_dir}",
+    )
+
+    _ = parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Pass --offline to use the cached documentation without contacting the server.",
+    )
+
+    _ = parser.add_argument(
+        "--parser",
+        "-p",
+        choices=parser_backends,
+        help="""BeautifulSoup parser backend. Defaults to html.parser.
+        lxml is considerably faster but requires the lxml package.""",
+    )
+
+    _ = parser.add_argument(
+        "--check",
+        "-c",
+        action="store_true",
+        help="""Pass --check or -c to compare the generated yaml with the files in the output
+        directory without writing anything. Exits with status 1 if any file differs.""",
+    )
+
+    _ = parser.add_argument(
+        "--catalog",
+        type=Path,
+        help="""Optional path to a schema catalogue json. If passed, the parsed tables are saved
+        to its cdm group, keeping any other groups and indexes already in the file.""",
+    )
+
     # Store paths in CLIArgs data class.
     args: CliArgs = parser.parse_args(namespace=CliArgs())
     output_dir: Path = args.output_dir.resolve()
+    args.output_dir = output_dir
 
     # Check/create output dir. Also includes overwrite check.
-    if output_dir.exists():
+    if args.check:
         if not output_dir.is_dir():
-            parser.exit(1, f"{args.output_dir} exists but is not a directory.")
+            parser.exit(1, f"{output_dir} is not a directory.")
+    elif output_dir.exists():
+        if not output_dir.is_dir():
+            parser.exit(1, f"{output_dir} exists but is not a directory.")
         if not args.overwrite and (
             any(output_dir.glob("*.yaml")) or any(output_dir.glob("*.yml"))
         ):
             parser.exit(
                 1,
-                f"""Exiting because {args.output_dir} contains .yaml files.
+                f"""Exiting because {output_dir} contains .yaml files.
     To overwrite them, pass the --overwrite or -o flag at runtime.""",
             )
     else:
@@ -135,7 +242,9 @@ def parse_cli_arguments() -> tuple[Path, Path]:
     # Check on url.
     if is_url(args.source):
         try:
-            source_path: Path = download_url_to_temp_file(args.source, args.output_dir)
+            source_path: Path = fetch_cached_source(
+                args.source, args.cache_dir.expanduser(), args.offline
+            )
         except Exception as e:
             parser.exit(1, f"Failed to download from {args.source}: {e}")
     else:
@@ -143,19 +252,19 @@ def parse_cli_arguments() -> tuple[Path, Path]:
         if not source_path.exists():
             parser.exit(1, f"Source file does not exist: {source_path}")
 
-    return source_path, output_dir
+    return source_path, args
 
 
-def table_handler(table: Tag) -> list[OmopDocumentationContainer]:
+def table_handler(table: Tag) -> list[ColumnSpec]:
     """Take a table and returns a list of objects that represent the tables in the table."""
     rows: list[Tag] = [_ensure_tag(div) for div in table.find_all("tr")]
 
     return [row_handler(row) for row in rows]
 
 
-def row_handler(row: Tag) -> OmopDocumentationContainer:
+def row_handler(row: Tag) -> ColumnSpec:
     """
-    Parses a row from a CDM documentation table into an OmopDocumentationContainer instance.
+    Parses a row from a CDM documentation table into a ColumnSpec instance.
 
     Take each row from a table and handle it, resulting in a object that can neatly
     store how the CDM docs express each column.
@@ -179,10 +288,10 @@ def row_handler(row: Tag) -> OmopDocumentationContainer:
         k: v.replace("\n", "").strip() for k, v in cells_raw.items()
     }
 
-    # Convert sentinels to booleans. Assign values to omop_documentation_container DataClass.
-    return OmopDocumentationContainer(
-        cdm_field=cells_stripped["cdm_field"],
-        user_guide=cells_stripped["user_guide"],
+    # Convert sentinels to booleans. Assign values to ColumnSpec DataClass.
+    return ColumnSpec(
+        name=cells_stripped["cdm_field"],
+        description=cells_stripped["user_guide"],
         etl_conventions=cells_stripped["etl_conventions"],
         datatype=cells_stripped["datatype"],
         required=sentinel_to_bool(cells_stripped["required"]),
@@ -202,9 +311,7 @@ def sentinel_to_bool(text: str) -> bool:
 
 
 def create_table_dict(
-    table: str,
-    table_description: str,
-    parsed_table: list[OmopDocumentationContainer],
+    table: TableSpec,
 ) -> dict[
     str,
     list[dict[str, str | list[dict[str, str | list[str | dict[str, dict[str, str]]]]]]],
@@ -220,11 +327,10 @@ def create_table_dict(
     ] = {
         "models": [
             {
-                "name": table,
-                "description": table_description,
+                "name": table.name,
+                "description": table.description,
                 "columns": [
-                    omop_docs_to_dbt_config(doc_container)
-                    for doc_container in parsed_table
+                    omop_docs_to_dbt_config(column) for column in table.columns
                 ],
             }
         ]
@@ -246,17 +352,17 @@ def extract_table_description(table_handle: Tag) -> str:
 
 
 def omop_docs_to_dbt_config(
-    doc_container: OmopDocumentationContainer,
+    doc_container: ColumnSpec,
 ) -> dict[str, str | list[str | dict[str, dict[str, str]]]]:
     """
-    Parse an OmopDocumentationContainer object ito dbt-config yaml format.
+    Parse a ColumnSpec object ito dbt-config yaml format.
 
     With an OMOP documentation object, we can use some simple string parsing/heuristic
     to create dbt test configs.
     """
     column_config: dict[str, str | list[str | dict[str, dict[str, str]]]] = {
-        "name": doc_container.cdm_field,
-        "description": doc_container.user_guide,
+        "name": doc_container.name,
+        "description": doc_container.description,
         "data_type": doc_container.datatype,
     }
 
@@ -286,7 +392,7 @@ def omop_docs_to_dbt_config(
                 "dbt_utils.relationships_where": {
                     "to": f"ref('{doc_container.foreign_key_table.lower()}')",
                     "field": f"{doc_container.foreign_key_table.lower()}_id",
-                    "from_condition": f"{doc_container.cdm_field} <> 0",
+                    "from_condition": f"{doc_container.name} <> 0",
                     "to_condition": f"domain_id = '{doc_container.foreign_key_domain}'",
                 }
             }
@@ -346,31 +452,130 @@ def extract_omop_table_names(soup_obj: BeautifulSoup) -> list[str]:
     return filtered_table_names
 
 
-def main(
-    source_path: Path,
-    output_dir: Path,
-) -> None:
-    """Main loop to generate dbt YAML files from the OMOP CDM documentation"""
+def index_table_divs(soup_obj: BeautifulSoup, tables: list[str]) -> dict[str, Tag]:
+    """Find the div for every table in a single pass over the document."""
+    wanted: set[str] = set(tables)
+    table_divs: dict[str, Tag] = {}
+    for div in soup_obj.find_all("div", id=True):
+        div_tag: Tag = _ensure_tag(div)
+        div_id = div_tag.get("id")
+        if isinstance(div_id, str) and div_id in wanted and div_id not in table_divs:
+            table_divs[div_id] = div_tag
+
+    missing: set[str] = wanted - table_divs.keys()
+    if missing:
+        raise ValueError(f"No documentation div found for tables: {sorted(missing)}")
+    return table_divs
+
+
+def create_yaml_writer() -> YAML:
+    """Create the YAML instance used to dump every table."""
+    yaml: YAML = YAML()
+    yaml.indent(
+        mapping=2, sequence=4, offset=2
+    )  # pyright: ignore[reportUnknownMemberType]
+    yaml.width = 100
+    return yaml
+
+
+def render_table_yaml(yaml: YAML, table_dict: object) -> str:
+    """Dump a table dictionary to a YAML string."""
+    stream: io.StringIO = io.StringIO()
+    yaml.dump(table_dict, stream)  # pyright: ignore[reportUnknownMemberType]
+    return stream.getvalue()
+
+
+def diff_table_yaml(yaml_path: Path, rendered: str) -> list[str]:
+    """
+    Return a unified diff between an existing YAML file and the rendered YAML.
+
+    Files with the same content are not reported, so line wrapping differences between
+    ruamel.yaml versions do not count as changes.
+    """
+    existing: str = yaml_path.read_text() if yaml_path.exists() else ""
+    safe_yaml: YAML = YAML(typ="safe")
+    if existing and safe_yaml.load(existing) == safe_yaml.load(
+        rendered
+    ):  # pyright: ignore[reportUnknownMemberType]
+        return []
+    return list(
+        difflib.unified_diff(
+            existing.splitlines(keepends=True),
+            rendered.splitlines(keepends=True),
+            fromfile=str(yaml_path),
+            tofile=f"{yaml_path} (generated)",
+        )
+    )
+
+
+def parse_cdm_tables(source_path: Path, parser: str = "html.parser") -> list[TableSpec]:
+    """Parse every table in the OMOP CDM documentation into TableSpec objects."""
     with open(source_path) as file_handle:
         file: str = file_handle.read()
 
-    soup: BeautifulSoup = BeautifulSoup(file, features="html.parser")
+    soup: BeautifulSoup = BeautifulSoup(file, features=parser)
 
     tables: list[str] = extract_omop_table_names(soup)
     print(f" Found {len(tables)} tables in the OMOP CDM documentation")
 
+    table_divs: dict[str, Tag] = index_table_divs(soup, tables)
+    table_specs: list[TableSpec] = []
     for table in tables:
-        # For each table generate the desired dbt yaml
-        # Get desired div with table
-        div_handle: Tag = _ensure_tag(soup.find("div", attrs={"id": table}))
-
+        div_handle: Tag = table_divs[table]
         table_handle: Tag = _ensure_tag(div_handle.find("table"))
         tbody_handle: Tag = _ensure_tag(table_handle.find("tbody"))
-        parsed_table: list[OmopDocumentationContainer] = table_handler(tbody_handle)
+        table_specs.append(
+            TableSpec(
+                name=table,
+                description=extract_table_description(div_handle),
+                columns=table_handler(tbody_handle),
+            )
+        )
+    return table_specs
+
+
+def update_catalog(catalog_path: Path, tables: list[TableSpec]) -> None:
+    """Save parsed CDM tables to the catalogue, keeping other groups and existing indexes."""
+    catalog: SchemaCatalog = (
+        load_catalog(catalog_path) if catalog_path.exists() else SchemaCatalog()
+    )
+    existing_indexes: dict[str, list[list[str]]] = {
+        table.name: table.indexes for table in catalog.groups.get("cdm", [])
+    }
+    for table in tables:
+        table.indexes = existing_indexes.get(table.name, table.indexes)
+    catalog.groups["cdm"] = tables
+    save_catalog(catalog, catalog_path)
+    print(f" Saved {len(tables)} tables to `{catalog_path}`")
 
-        table_description: str = extract_table_description(div_handle)
 
-        # TODO: Look at turning this structure into a dataclass or pydantic BaseModel class.
+def main(
+    source_path: Path,
+    output_dir: Path,
+    parser: str = "html.parser",
+    check: bool = False,
+    catalog_path: Path | None = None,
+) -> int:
+    """
+    Main loop to generate dbt YAML files from the OMOP CDM documentation.
+
+    Returns:
+         Exit status. In check mode this is 1 if any generated file differs from the output directory.
+    """
+    if source_path.suffix == ".json":
+        tables: list[TableSpec] = load_catalog(source_path).tables("cdm")
+        print(f" Found {len(tables)} tables in the schema catalogue")
+    else:
+        tables = parse_cdm_tables(source_path, parser)
+
+    if catalog_path and not check:
+        update_catalog(catalog_path, tables)
+
+    yaml: YAML = create_yaml_writer()
+    changed: list[str] = []
+
+    for table in tables:
+        # For each table generate the desired dbt yaml
         table_dict: dict[
             str,
             list[
@@ -379,21 +584,33 @@ def main(
                     str | list[dict[str, str | list[str | dict[str, dict[str, str]]]]],
                 ]
             ],
-        ] = create_table_dict(table, table_description, parsed_table)
+        ] = create_table_dict(table)
+
+        rendered: str = render_table_yaml(yaml, table_dict)
+        yaml_path: Path = output_dir / f"{table.name}.yml"
 
-        yaml: YAML = YAML()
-        yaml.indent(mapping=2, sequence=4, offset=2)  # pyright: ignore[reportUnknownMemberType]
-        yaml.width = 100
-        yaml.dump(table_dict, open(f"{output_dir}/{table}.yml", "w"))  # pyright: ignore[reportUnknownMemberType]
-        yaml.allow_duplicate_keys
+        if check:
+            diff: list[str] = diff_table_yaml(yaml_path, rendered)
+            if diff:
+                changed.append(table.name)
+                sys.stdout.writelines(diff)
+        else:
+            _ = yaml_path.write_text(rendered)
 
-        if source_path.suffix == ".tmp" and source_path.exists():
-            source_path.unlink()
+    if check:
+        if changed:
+            print(
+                f" {len(changed)} file(s) in `{output_dir}` are out of date: {changed}"
+            )
+            return 1
+        print(f" All files in `{output_dir}` are up to date")
+        return 0
 
     print(f" Exported to `{output_dir}`")
     print("  Done!")
+    return 0
 
 
 if __name__ == "__main__":
-    source, output_dir = parse_cli_arguments()
-    main(source, output_dir)
+    source, args = parse_cli_arguments()
+    sys.exit(main(source, args.output_dir, args.parser, args.check, args.catalog))
@@ -7,8 +7,11 @@
 # used to generate seed vocabulary subset
 # this script filters the OMOP vocabulary tables to only include concepts found in a CDM
 # taken from https://github.com/OHDSI/Tutorial-Hades/blob/main/extras/FilterVocabulary.R
+# the concept ids used are stored in the target schema, so with --incremental a later run only appends the rows
+# for newly referenced concepts. --verify checks the shard matches what a full rebuild would produce.
 
 from pathlib import Path
+import sys
 from typing import cast
 
 import duckdb
@@ -24,8 +27,13 @@ class CliArgs:
     db_file: Path = Path()
     source_schema: str = ""
     target_schema: str = ""
+    incremental: bool = False
+    verify: bool = False
 
 
+# Concept ids the shard was built from, stored in the target schema.
+state_table: str = "_shard_concept_ids"
+
 # Initialize table lists.
 vocab_tables: list[str] = [
     "concept",
@@ -80,6 +88,20 @@ def parse_cli_arguments() -> CliArgs:
     _ = parser.add_argument(
         "target_schema", type=str, help="Target schema. Example: vocab_shard"
     )
+    _ = parser.add_argument(
+        "--incremental",
+        "-i",
+        action="store_true",
+        help="""Only append rows for concepts not referenced when the shard was last built.
+        Falls back to a full build if the target schema has no shard yet.
+        Concepts that are no longer referenced are kept, run without --incremental to remove them.""",
+    )
+    _ = parser.add_argument(
+        "--verify",
+        "-v",
+        action="store_true",
+        help="Check the shard matches a full rebuild from the source schema.",
+    )
 
     # Store paths in CLIArgs data class.
     args: CliArgs = parser.parse_args(namespace=CliArgs())
@@ -100,7 +122,9 @@ def collate_concept_ids(conn: DuckDBPyConnection, args: CliArgs) -> None:
 
     for table in non_vocab_tables:
         print(f"Searching table {table}")
-        sql_non_vocab: str = f'SELECT "name" FROM pragma_table_info({args.source_schema}.{table}) WHERE "name" LIKE \'%_concept_id\';'
+        sql_non_vocab: str = (
+            f'SELECT "name" FROM pragma_table_info({args.source_schema}.{table}) WHERE "name" LIKE \'%_concept_id\';'
+        )
         field_tuples: list[tuple[str]] = cast(
             "list[tuple[str]]", conn.sql(sql_non_vocab).fetchall()
         )
@@ -123,20 +147,78 @@ def expand_concept_ids_with_parents(conn: DuckDBPyConnection, args: CliArgs) ->
     expanded_ids.insert_into("cids")
 
 
+def concept_id_fields(conn: DuckDBPyConnection, args: CliArgs, table: str) -> list[str]:
+    """Return the concept id fields of a vocab table."""
+    vocab_fields_tuples: list[tuple[str]] = conn.sql(
+        f'SELECT "name" from pragma_table_info({args.source_schema}.{table}) WHERE "name" LIKE \'%concept_id%\';'
+    ).fetchall()
+    return [field for (field,) in vocab_fields_tuples]
+
+
+def filtered_vocab_sql(conn: DuckDBPyConnection, args: CliArgs, table: str) -> str:
+    """Return a query selecting the rows of a vocab table whose concept ids are all in cids."""
+    sql_vocab: str = f"SELECT * FROM {args.source_schema}.{table} WHERE "
+    sql_vocab += " AND ".join(
+        [
+            f"{field} IN (SELECT concept_id FROM cids)"
+            for field in concept_id_fields(conn, args, table)
+        ]
+    )
+    return sql_vocab
+
+
+def shard_exists(conn: DuckDBPyConnection, args: CliArgs) -> bool:
+    """Check the target schema holds a shard built by this script."""
+    existing: set[str] = {
+        name
+        for (name,) in conn.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_schema = ?",
+            [args.target_schema],
+        ).fetchall()
+    }
+    return {state_table, *vocab_tables, *vocab_tables_preserve} <= existing
+
+
 def create_filtered_vocab_tables(conn: DuckDBPyConnection, args: CliArgs) -> None:
     _ = conn.sql(f"CREATE SCHEMA IF NOT EXISTS {args.target_schema}")
     for table in vocab_tables:
         print(f"Filtering table {table}")
         _ = conn.sql(f"DROP TABLE IF EXISTS {args.target_schema}.{table};")
-        vocab_fields_tuples: list[tuple[str]] = conn.sql(
-            f'SELECT "name" from pragma_table_info({args.source_schema}.{table}) WHERE "name" LIKE \'%concept_id%\';'
-        ).fetchall()
-        vocab_fields: list[str] = [field for (field,) in vocab_fields_tuples]
-        sql_vocab: str = f"CREATE TABLE {args.target_schema}.{table} AS SELECT * FROM {args.source_schema}.{table} WHERE "
-        sql_vocab += " AND ".join(
-            [f"{field} IN (SELECT concept_id FROM cids)" for field in vocab_fields]
+        _ = conn.sql(
+            f"CREATE TABLE {args.target_schema}.{table} AS {filtered_vocab_sql(conn, args, table)}"
         )
-        _ = conn.sql(sql_vocab)
+
+
+def append_filtered_vocab_rows(conn: DuckDBPyConnection, args: CliArgs) -> int:
+    """Append the rows referencing a concept id that is new since the shard was built. Returns the delta size."""
+    _ = conn.sql(
+        f"""CREATE TEMPORARY TABLE new_cids AS
+        SELECT DISTINCT concept_id FROM cids
+        EXCEPT SELECT concept_id FROM {args.target_schema}.{state_table};"""
+    )
+    new_count: int = cast(
+        tuple[int], conn.sql("SELECT count(*) FROM new_cids").fetchone()
+    )[0]
+    print(f"Found {new_count} new concept ids")
+    if new_count == 0:
+        return 0
+
+    for table in vocab_tables:
+        # Rows with no new concept ids were already eligible, so are already in the shard.
+        sql_new: str = " OR ".join(
+            [
+                f"{field} IN (SELECT concept_id FROM new_cids)"
+                for field in concept_id_fields(conn, args, table)
+            ]
+        )
+        print(f"Appending to table {table}")
+        _ = conn.sql(
+            f"INSERT INTO {args.target_schema}.{table} {filtered_vocab_sql(conn, args, table)} AND ({sql_new})"
+        )
+    _ = conn.sql(
+        f"INSERT INTO {args.target_schema}.{state_table} SELECT concept_id FROM new_cids;"
+    )
+    return new_count
 
 
 def create_non_filtered_vocab_tables(conn: DuckDBPyConnection, args: CliArgs) -> None:
@@ -147,6 +229,39 @@ def create_non_filtered_vocab_tables(conn: DuckDBPyConnection, args: CliArgs) ->
         _ = conn.sql(sql_vocab)
 
 
+def save_concept_ids(conn: DuckDBPyConnection, args: CliArgs) -> None:
+    """Store the concept ids the shard was built from, for later incremental runs."""
+    _ = conn.sql(
+        f"CREATE OR REPLACE TABLE {args.target_schema}.{state_table} AS SELECT DISTINCT concept_id FROM cids;"
+    )
+
+
+def verify_shard(conn: DuckDBPyConnection, args: CliArgs) -> bool:
+    """Compare every shard table with the rows a full rebuild would produce."""
+    matches: bool = True
+    expected_tables: list[tuple[str, str]] = [
+        (table, filtered_vocab_sql(conn, args, table)) for table in vocab_tables
+    ] + [
+        (table, f"SELECT * FROM {args.source_schema}.{table}")
+        for table in vocab_tables_preserve
+    ]
+    for table, expected_sql in expected_tables:
+        missing, extra = cast(
+            tuple[int, int],
+            conn.sql(
+                f"""SELECT
+                (SELECT count(*) FROM ({expected_sql} EXCEPT ALL SELECT * FROM {args.target_schema}.{table})),
+                (SELECT count(*) FROM (SELECT * FROM {args.target_schema}.{table} EXCEPT ALL {expected_sql}))"""
+            ).fetchone(),
+        )
+        if missing or extra:
+            matches = False
+            print(
+                f"Table {table} differs from a full rebuild: {missing} rows missing, {extra} extra rows"
+            )
+    return matches
+
+
 def main() -> None:
     # Parse args.
     args: CliArgs = parse_cli_arguments()
@@ -155,8 +270,17 @@ def main() -> None:
     with duckdb.connect(args.db_file) as conn:
         collate_concept_ids(conn, args)
         expand_concept_ids_with_parents(conn, args)
-        create_filtered_vocab_tables(conn, args)
-        create_non_filtered_vocab_tables(conn, args)
+        if args.incremental and shard_exists(conn, args):
+            _ = append_filtered_vocab_rows(conn, args)
+        else:
+            create_filtered_vocab_tables(conn, args)
+            create_non_filtered_vocab_tables(conn, args)
+            save_concept_ids(conn, args)
+
+        if args.verify:
+            if not verify_shard(conn, args):
+                sys.exit(1)
+            print("Shard matches a full rebuild")
 
 
 if __name__ == "__main__":
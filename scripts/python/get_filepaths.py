@@ -4,34 +4,63 @@
 # dependencies = []
 # ///
 
-# get a list of all csv or parquet files in a directory and return a json object with the file names as keys and the file paths as values
+# get all csv or parquet files under one or more directories and return a json object with the table names as keys
+# and lists of file paths (or globs) as values, for use with the load_data_duckdb macro.
+# files are grouped into one table when:
+#  - they share a file name across directories, e.g. run_1/observations.csv and run_2/observations.csv
+#  - they are numbered batches of the same table, e.g. observations_0001.csv and observations_0002.csv
+#  - they sit in a hive-partitioned tree, e.g. observations/year=2020/data_0.parquet, which is emitted as a glob
 
 import json
+import re
 import sys
 from pathlib import Path
 
-# Create a resolved path from passed in directory argument.
-directory: Path = Path(sys.argv[1]).resolve()
-
-# Create a list of csv file paths.
-csv_file_paths: list[Path] = [
-    path for path in directory.iterdir() if path.suffix == ".csv"
-]
-parquet_file_paths: list[Path] = [
-    path for path in directory.iterdir() if path.suffix == ".parquet"
-]
-
-# Create a dictionary of filename: path_string and print in JSON format.
-if csv_file_paths and parquet_file_paths:
-    raise ValueError(
-        "Both CSV and Parquet files found — only one format should be present to avoid ambiguity."
-    )
-elif csv_file_paths:
-    file_dict: dict[str, str] = {path.stem: str(path) for path in csv_file_paths}
-elif parquet_file_paths:
-    file_dict = {path.stem: str(path) for path in parquet_file_paths}
-else:
-    raise FileNotFoundError(f"No csv or parquet files found in {directory}.")
+file_suffixes: set[str] = {".csv", ".parquet"}
+batch_stem: re.Pattern[str] = re.compile(r"(?P<table>.+?)[_-]\d+")
+
+
+def table_source(path: Path, directory: Path) -> tuple[str, str]:
+    """Return the table a file belongs to, and the path or glob to read it with."""
+    parents: list[str] = list(path.relative_to(directory).parent.parts)
+    if parents and "=" in parents[-1]:
+        # Hive partitions: the table is the directory above the partition directories.
+        while parents and "=" in parents[-1]:
+            _ = parents.pop()
+        table_root: Path = directory.joinpath(*parents)
+        return table_root.name.lower(), str(table_root / "**" / f"*{path.suffix}")
+
+    batch_match: re.Match[str] | None = batch_stem.fullmatch(path.stem)
+    table: str = batch_match.group("table") if batch_match else path.stem
+    return table.lower(), str(path)
+
+
+def discover_sources(directories: list[Path]) -> dict[str, list[str]]:
+    """Group every csv and parquet file under the directories by table."""
+    sources: dict[str, list[str]] = {}
+    for directory in directories:
+        for path in sorted(directory.rglob("*")):
+            if path.suffix not in file_suffixes or not path.is_file():
+                continue
+            table, source = table_source(path, directory)
+            if source not in sources.setdefault(table, []):
+                sources[table].append(source)
+
+    if not sources:
+        raise FileNotFoundError(
+            f"No csv or parquet files found in {', '.join(map(str, directories))}."
+        )
+
+    for table, paths in sources.items():
+        if len({Path(path).suffix for path in paths}) > 1:
+            raise ValueError(
+                f"Both CSV and Parquet files found for {table} — only one format should be present to avoid ambiguity."
+            )
+    return sources
+
+
+# Create resolved paths from the passed in directory arguments.
+directories: list[Path] = [Path(argument).resolve() for argument in sys.argv[1:]]
 
 # Print dictionary as JSON.
-print(json.dumps(file_dict))
+print(json.dumps(discover_sources(directories)))
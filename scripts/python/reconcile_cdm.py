@@ -0,0 +1,567 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["duckdb<=1.3"]
+# ///
+
+"""
+Reconcile a DuckDB OMOP CDM build against its Synthea sources, or against another CDM build.
+
+Each table is scanned once, computing row count, distinct persons, date range and a histogram
+of its clinical concept id column (CDM to CDM) or of its source codes (Synthea `code` against the
+CDM `*_source_value` column). The two sides are then compared:
+ - counts differing by more than --tolerance (a fraction, e.g. 0.01 for 1%) fail.
+ - dates differing by more than --date-tolerance days fail.
+ - concept ids or codes whose counts differ by more than --tolerance fail.
+
+Synthea tables do not map one to one onto CDM tables, so `source` compares domain groups,
+e.g. Synthea medications and immunizations against drug_exposure. Codes that are not mapped,
+or that are routed to another domain, make the row counts differ, so a tolerance is expected.
+Synthea timestamps are compared as dates in --time-zone, which should match the project's
+dbt_date:time_zone (or the --time-zone given to csv_to_parquet.py --normalise).
+
+Examples:
+./reconcile_cdm.py cdm synthea_omop_etl.duckdb reference.duckdb --right-schema etl_synthea
+./reconcile_cdm.py --tolerance 0.05 --date-tolerance 1 source synthea_omop_etl.duckdb --time-zone UTC
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+
+import duckdb
+from duckdb import DuckDBPyConnection
+
+from schema_catalog import SchemaCatalog, TableSpec, load_catalog
+
+# Tables compared by default in cdm mode, as in scripts/R/etlSyntheaValidation.R.
+event_tables: list[str] = [
+    "person",
+    "observation_period",
+    "death",
+    "visit_occurrence",
+    "visit_detail",
+    "procedure_occurrence",
+    "drug_exposure",
+    "device_exposure",
+    "condition_occurrence",
+    "measurement",
+    "observation",
+    "provider",
+    "payer_plan_period",
+    "cost",
+    "drug_era",
+    "condition_era",
+]
+
+# The concept id column compared for each CDM table: the clinical concept, not the type concept.
+concept_columns: dict[str, str] = {
+    "person": "gender_concept_id",
+    "observation_period": "period_type_concept_id",
+    "death": "cause_concept_id",
+    "visit_occurrence": "visit_concept_id",
+    "visit_detail": "visit_detail_concept_id",
+    "procedure_occurrence": "procedure_concept_id",
+    "drug_exposure": "drug_concept_id",
+    "device_exposure": "device_concept_id",
+    "condition_occurrence": "condition_concept_id",
+    "measurement": "measurement_concept_id",
+    "observation": "observation_concept_id",
+    "provider": "specialty_concept_id",
+    "payer_plan_period": "payer_concept_id",
+    "cost": "cost_type_concept_id",
+    "drug_era": "drug_concept_id",
+    "condition_era": "condition_concept_id",
+}
+
+# The column holding the Synthea code for each CDM table, compared in source mode.
+source_value_columns: dict[str, str] = {
+    "person": "gender_source_value",
+    "visit_occurrence": "visit_source_value",
+    "procedure_occurrence": "procedure_source_value",
+    "drug_exposure": "drug_source_value",
+    "device_exposure": "device_source_value",
+    "condition_occurrence": "condition_source_value",
+    "measurement": "measurement_source_value",
+    "observation": "observation_source_value",
+}
+
+
+@dataclass
+class TablePart:
+    """A table to aggregate, with the expressions giving its person, date and histogrammed value."""
+
+    relation: str
+    person: str | None
+    event_date: str | None
+    where: str = "true"
+    value: str | None = None
+
+
+@dataclass
+class SourceCheck:
+    """A group of Synthea tables and the CDM tables they are loaded into."""
+
+    name: str
+    synthea: list[TablePart]
+    cdm: list[str]
+
+
+@dataclass
+class Aggregates:
+    """Aggregates computed in a single pass over one side of a check."""
+
+    rows: int
+    persons: int | None
+    min_date: date | None
+    max_date: date | None
+    histogram: dict[int | str, int] = field(default_factory=dict)
+
+
+@dataclass
+class Difference:
+    """A compared metric, and whether it is within tolerance."""
+
+    check: str
+    metric: str
+    left: object
+    right: object
+    ok: bool
+
+
+source_checks: list[SourceCheck] = [
+    SourceCheck(
+        "person", [TablePart("patients", "id", None, value="gender")], ["person"]
+    ),
+    SourceCheck(
+        "death",
+        [TablePart("patients", "id", "deathdate", "deathdate IS NOT NULL")],
+        ["death"],
+    ),
+    SourceCheck(
+        "visits",
+        [TablePart("encounters", "patient", '"start"', value="encounterclass")],
+        ["visit_occurrence"],
+    ),
+    SourceCheck(
+        "conditions",
+        [TablePart("conditions", "patient", '"start"', value="code")],
+        ["condition_occurrence"],
+    ),
+    SourceCheck(
+        "drugs",
+        [
+            TablePart("medications", "patient", '"start"', value="code"),
+            TablePart("immunizations", "patient", '"date"', value="code"),
+        ],
+        ["drug_exposure"],
+    ),
+    SourceCheck(
+        "procedures",
+        [TablePart("procedures", "patient", '"start"', value="code")],
+        ["procedure_occurrence"],
+    ),
+    SourceCheck(
+        "measurements and observations",
+        [
+            TablePart("observations", "patient", '"date"', value="code"),
+            TablePart("allergies", "patient", '"start"', value="code"),
+        ],
+        ["measurement", "observation"],
+    ),
+    SourceCheck(
+        "devices",
+        [TablePart("devices", "patient", '"start"', value="code")],
+        ["device_exposure"],
+    ),
+]
+
+
+def cdm_part(
+    catalog: SchemaCatalog, relation: str, table: str, source_values: bool = False
+) -> TablePart:
+    """
+    Return the person and first date column of a CDM table, with its concept id column.
+
+    With source_values, the *_source_value column holding the Synthea code is used instead.
+    Tables not in concept_columns / source_value_columns get no histogram.
+    """
+    table_spec: TableSpec | None = catalog.table("cdm", table)
+    if table_spec is None:
+        raise KeyError(f"{table} is not a CDM table in the schema catalogue.")
+    column_names: list[str] = [column.name for column in table_spec.columns]
+    date_columns: list[str] = [
+        column.name
+        for column in table_spec.columns
+        if column.datatype.lower() == "date"
+    ]
+    return TablePart(
+        relation=relation,
+        person="person_id" if "person_id" in column_names else None,
+        event_date=date_columns[0] if date_columns else None,
+        value=(source_value_columns if source_values else concept_columns).get(table),
+    )
+
+
+def aggregate(
+    conn: DuckDBPyConnection, parts: list[TablePart], value_type: str = "BIGINT"
+) -> Aggregates:
+    """Compute the aggregates of one or more tables in a single pass over each."""
+    selects: list[str] = [
+        "SELECT "
+        + f"{part.person if part.person else 'NULL'} AS person, "
+        + f"{f'CAST({part.event_date} AS DATE)' if part.event_date else 'CAST(NULL AS DATE)'} AS event_date, "
+        + f"CAST({part.value if part.value else 'NULL'} AS {value_type}) AS value "
+        + f"FROM {part.relation} WHERE {part.where}"
+        for part in parts
+    ]
+    has_persons: bool = any(part.person for part in parts)
+    has_values: bool = any(part.value for part in parts)
+    row = conn.execute(
+        f"""
+        SELECT
+            count(*)
+            , count(DISTINCT person)
+            , min(event_date)
+            , max(event_date)
+            , {"histogram(value) FILTER (WHERE value IS NOT NULL)" if has_values else "NULL"}
+        FROM ({" UNION ALL ".join(selects)})
+        """
+    ).fetchone()
+    rows, persons, min_date, max_date, histogram = (
+        row  # pyright: ignore[reportGeneralTypeIssues, reportOptionalIterable]
+    )
+    return Aggregates(
+        rows=rows,
+        persons=persons if has_persons else None,
+        min_date=min_date,
+        max_date=max_date,
+        histogram=dict(histogram or {}),
+    )
+
+
+def within(left: int, right: int, tolerance: float) -> bool:
+    """Return whether two counts differ by at most tolerance, relative to the larger."""
+    return abs(left - right) <= tolerance * max(left, right)
+
+
+def compare(
+    check: str,
+    left: Aggregates,
+    right: Aggregates,
+    tolerance: float,
+    date_tolerance: int,
+    value_name: str = "concept",
+) -> list[Difference]:
+    """Compare the aggregates of both sides of a check, naming histogram values value_name."""
+    differences: list[Difference] = [
+        Difference(
+            check,
+            "rows",
+            left.rows,
+            right.rows,
+            within(left.rows, right.rows, tolerance),
+        )
+    ]
+    if left.persons is not None and right.persons is not None:
+        differences.append(
+            Difference(
+                check,
+                "persons",
+                left.persons,
+                right.persons,
+                within(left.persons, right.persons, tolerance),
+            )
+        )
+    for metric in ["min_date", "max_date"]:
+        left_date: date | None = getattr(left, metric)
+        right_date: date | None = getattr(right, metric)
+        if left_date is None and right_date is None:
+            continue
+        ok: bool = (
+            left_date is not None
+            and right_date is not None
+            and abs((left_date - right_date).days) <= date_tolerance
+        )
+        differences.append(Difference(check, metric, left_date, right_date, ok))
+
+    if left.histogram or right.histogram:
+        mismatched: list[int | str] = sorted(
+            (
+                value
+                for value in left.histogram.keys() | right.histogram.keys()
+                if not within(
+                    left.histogram.get(value, 0),
+                    right.histogram.get(value, 0),
+                    tolerance,
+                )
+            ),
+            key=lambda value: abs(
+                left.histogram.get(value, 0) - right.histogram.get(value, 0)
+            ),
+            reverse=True,
+        )
+        differences.append(
+            Difference(
+                check,
+                f"{value_name}s",
+                len(left.histogram),
+                len(right.histogram),
+                not mismatched,
+            )
+        )
+        # Report the values with the largest differences.
+        for value in mismatched[:5]:
+            differences.append(
+                Difference(
+                    check,
+                    f"{value_name} {value}",
+                    left.histogram.get(value, 0),
+                    right.histogram.get(value, 0),
+                    False,
+                )
+            )
+    return differences
+
+
+def attach(conn: DuckDBPyConnection, db_files: list[Path]) -> list[str]:
+    """Attach each database read-only, once per distinct file, and return their aliases."""
+    aliases: dict[Path, str] = {}
+    for db_file in db_files:
+        if db_file not in aliases:
+            aliases[db_file] = f"db_{len(aliases)}"
+            _ = conn.execute(f"ATTACH '{db_file}' AS {aliases[db_file]} (READ_ONLY)")
+    return [aliases[db_file] for db_file in db_files]
+
+
+def existing_tables(conn: DuckDBPyConnection, catalog: str, schema: str) -> set[str]:
+    """Return the tables and views in a schema of an attached database."""
+    return {
+        name
+        for (name,) in conn.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_catalog = ? AND table_schema = ?",
+            [catalog, schema],
+        ).fetchall()
+    }
+
+
+def column_types(
+    conn: DuckDBPyConnection, catalog: str, schema: str, table: str
+) -> dict[str, str]:
+    """Return the data type of every column of a table in an attached database, by lower case name."""
+    return {
+        name.lower(): data_type
+        for name, data_type in conn.execute(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            + "WHERE table_catalog = ? AND table_schema = ? AND table_name = ?",
+            [catalog, schema, table],
+        ).fetchall()
+    }
+
+
+def local_event_date(
+    event_date: str | None, data_type: str | None, time_zone: str
+) -> str | None:
+    """
+    Return a Synthea date expression as staging sees it.
+
+    TIMESTAMPTZ columns are converted to naive timestamps in time_zone, as staging does in
+    dbt_date:time_zone. Columns already normalised by csv_to_parquet.py are used as they are.
+    """
+    if event_date is None or data_type != "TIMESTAMP WITH TIME ZONE":
+        return event_date
+    return f"timezone('{time_zone}', {event_date})"
+
+
+def reconcile_cdm(
+    conn: DuckDBPyConnection, args: argparse.Namespace
+) -> list[Difference]:
+    """Compare two CDM builds table by table."""
+    left_alias, right_alias = attach(conn, [args.left, args.right])
+    catalog: SchemaCatalog = load_catalog()
+    left_tables: set[str] = existing_tables(conn, left_alias, args.left_schema)
+    right_tables: set[str] = existing_tables(conn, right_alias, args.right_schema)
+
+    differences: list[Difference] = []
+    for table in args.tables or event_tables:
+        if table not in left_tables or table not in right_tables:
+            differences.append(
+                Difference(
+                    table, "exists", table in left_tables, table in right_tables, False
+                )
+            )
+            continue
+        left_part: TablePart = cdm_part(
+            catalog, f"{left_alias}.{args.left_schema}.{table}", table
+        )
+        right_part: TablePart = cdm_part(
+            catalog, f"{right_alias}.{args.right_schema}.{table}", table
+        )
+        differences += compare(
+            table,
+            aggregate(conn, [left_part]),
+            aggregate(conn, [right_part]),
+            args.tolerance,
+            args.date_tolerance,
+        )
+    return differences
+
+
+def reconcile_source(
+    conn: DuckDBPyConnection, args: argparse.Namespace
+) -> list[Difference]:
+    """Compare the Synthea source tables with the CDM tables they are loaded into."""
+    (alias,) = attach(conn, [args.db_file])
+    catalog: SchemaCatalog = load_catalog()
+    synthea_tables: set[str] = existing_tables(conn, alias, args.synthea_schema)
+
+    differences: list[Difference] = []
+    for check in source_checks:
+        synthea_parts: list[TablePart] = [
+            TablePart(
+                f"{alias}.{args.synthea_schema}.{part.relation}",
+                part.person,
+                local_event_date(
+                    part.event_date,
+                    column_types(conn, alias, args.synthea_schema, part.relation).get(
+                        (part.event_date or "").strip('"').lower()
+                    ),
+                    args.time_zone,
+                ),
+                part.where,
+                part.value,
+            )
+            for part in check.synthea
+            if part.relation in synthea_tables
+        ]
+        if not synthea_parts:
+            continue
+        cdm_parts: list[TablePart] = [
+            cdm_part(
+                catalog, f"{alias}.{args.cdm_schema}.{table}", table, source_values=True
+            )
+            for table in check.cdm
+        ]
+        differences += compare(
+            check.name,
+            aggregate(conn, synthea_parts, value_type="VARCHAR"),
+            aggregate(conn, cdm_parts, value_type="VARCHAR"),
+            args.tolerance,
+            args.date_tolerance,
+            value_name="code",
+        )
+    return differences
+
+
+def parse_cli_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="""Reconcile a DuckDB OMOP CDM build against its Synthea sources or another CDM build."""
+    )
+    _ = parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.0,
+        help="Allowed relative difference in counts, e.g. 0.01 for 1%%. Defaults to 0.",
+    )
+    _ = parser.add_argument(
+        "--date-tolerance",
+        dest="date_tolerance",
+        type=int,
+        default=0,
+        help="Allowed difference in days between date ranges. Defaults to 0.",
+    )
+    _ = parser.add_argument(
+        "--json",
+        type=Path,
+        help="Optional path to write every compared metric to as json.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    cdm_parser = subparsers.add_parser("cdm", help="Compare two CDM builds.")
+    _ = cdm_parser.add_argument(
+        "left", type=Path, help="Path to the first DuckDB database."
+    )
+    _ = cdm_parser.add_argument(
+        "right",
+        type=Path,
+        help="Path to the second DuckDB database. May be the same file.",
+    )
+    _ = cdm_parser.add_argument(
+        "--left-schema", dest="left_schema", default="dbt_synthea_dev"
+    )
+    _ = cdm_parser.add_argument(
+        "--right-schema", dest="right_schema", default="dbt_synthea_dev"
+    )
+    _ = cdm_parser.add_argument(
+        "--tables",
+        "-t",
+        nargs="+",
+        help="Tables to compare. Defaults to the event tables.",
+    )
+
+    source_parser = subparsers.add_parser(
+        "source", help="Compare a CDM build with its Synthea sources."
+    )
+    _ = source_parser.add_argument(
+        "db_file", type=Path, help="Path to the DuckDB database."
+    )
+    _ = source_parser.add_argument(
+        "--cdm-schema", dest="cdm_schema", default="dbt_synthea_dev"
+    )
+    _ = source_parser.add_argument(
+        "--synthea-schema", dest="synthea_schema", default="dbt_synthea_dev_synthea"
+    )
+    _ = source_parser.add_argument(
+        "--time-zone",
+        "-tz",
+        dest="time_zone",
+        default="UTC",
+        help="The dbt_date:time_zone of the project, used to convert Synthea timestamps to dates. Defaults to UTC.",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+    for db_file in [args.left, args.right] if args.command == "cdm" else [args.db_file]:
+        if not db_file.is_file():
+            parser.exit(1, f"Database does not exist: {db_file}")
+    if args.command == "cdm":
+        args.left, args.right = args.left.resolve(), args.right.resolve()
+    else:
+        args.db_file = args.db_file.resolve()
+    return args
+
+
+def main() -> int:
+    args: argparse.Namespace = parse_cli_arguments()
+    conn: DuckDBPyConnection = duckdb.connect()
+
+    if args.command == "cdm":
+        differences: list[Difference] = reconcile_cdm(conn, args)
+    else:
+        differences = reconcile_source(conn, args)
+
+    for difference in differences:
+        status: str = "ok" if difference.ok else "FAIL"
+        print(
+            f"{difference.check:<30} {difference.metric:<18} "
+            + f"{str(difference.left):>12} {str(difference.right):>12}  {status}"
+        )
+    if args.json:
+        _ = args.json.write_text(
+            json.dumps([asdict(d) for d in differences], indent=2, default=str)
+        )
+        print(f" Exported to `{args.json}`")
+
+    failures: int = sum(not difference.ok for difference in differences)
+    if failures:
+        print(f" {failures} of {len(differences)} checks failed")
+        return 1
+    print("  Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = []
+# ///
+
+"""
+Run dbt against DuckDB with heavy models serialised and light models fanned out.
+
+Each model declares a cost class (heavy, medium or light) in config.meta.cost_class, see
+dbt_project.yml. DuckDB shares one thread pool and memory limit between every model dbt runs
+concurrently, so heavy models running side by side compete for memory and spill to disk.
+This script runs the project in rounds:
+ - every light/medium model that does not depend on a pending heavy model, using --threads N.
+ - then every heavy model whose parents have been built, one at a time.
+Each round is a separate `dbt run` with `duckdb_cost_scheduling: true`, so the
+apply_cost_class pre-hook sets the DuckDB settings for each model's cost class. Every round
+also passes duckdb_round_settings, so fanned out models do not run with the DuckDB defaults:
+ - threads: --threads. The pool is shared by every model in the round, so once the small
+   models of a fan-out round finish, the larger medium models still use every core.
+ - memory_limit: --memory-limit, shared by every model in the round.
+
+Each round pays the start-up cost of a dbt invocation, so scheduling only pays off when model
+run time dominates. Measured on 1 core with the 27 patient seed data (87 models, 4 rounds,
+median of 3 runs): plain `dbt run` 22.8s, this script 44.3s. Benchmark it on your own data
+before relying on it.
+
+Must be run from the dbt project directory with dbt-duckdb installed. Extra arguments are
+passed through to dbt, e.g:
+python3 scripts/python/schedule_duckdb_run.py --threads 16 -- --target dev
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+
+def default_memory_limit() -> str | None:
+    """Return 80% of physical memory as a DuckDB size, or None where it cannot be read."""
+    try:
+        total_bytes: int = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+    return f"{total_bytes * 8 // 10 // 2**20}MiB"
+
+
+@dataclass
+class CliArgs:
+    """A dataclass to ensure correct typing of command line arguments"""
+
+    threads: int = os.cpu_count() or 1
+    select: list[str] = field(default_factory=list)
+    memory_limit: str | None = default_memory_limit()
+    vars: str = "{}"
+    dry_run: bool = False
+    dbt_args: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ModelNode:
+    """A model, its cost class and the models it depends on."""
+
+    unique_id: str
+    name: str
+    cost_class: str
+    parents: set[str]
+
+
+def parse_cli_arguments() -> CliArgs:
+    """Parse command line arguments."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="""Run dbt against DuckDB with heavy models serialised and light models fanned out."""
+    )
+    _ = parser.add_argument(
+        "--threads",
+        "-t",
+        type=int,
+        help="dbt threads used for light and medium models. Defaults to the number of cores.",
+    )
+    _ = parser.add_argument(
+        "--select",
+        "-s",
+        nargs="+",
+        help="Optional dbt selection to schedule. Defaults to every model in the project.",
+    )
+    _ = parser.add_argument(
+        "--memory-limit",
+        "-m",
+        dest="memory_limit",
+        type=str,
+        help="DuckDB memory_limit for every round, e.g. 24GB. Defaults to 80%% of physical memory.",
+    )
+    _ = parser.add_argument(
+        "--vars",
+        type=str,
+        help="Optional dbt vars as a json object, merged with duckdb_cost_scheduling: true.",
+    )
+    _ = parser.add_argument(
+        "--dry-run",
+        dest="dry_run",
+        action="store_true",
+        help="Print the rounds without running them.",
+    )
+    _ = parser.add_argument(
+        "dbt_args",
+        nargs="*",
+        help="Extra arguments passed to every dbt command, after --. e.g. -- --target dev",
+    )
+
+    args: CliArgs = parser.parse_args(namespace=CliArgs())
+    try:
+        _ = json.loads(args.vars)
+    except json.JSONDecodeError as e:
+        parser.exit(1, f"--vars must be a json object: {e}")
+    return args
+
+
+def list_models(select: list[str], dbt_args: list[str]) -> dict[str, ModelNode]:
+    """List the selected models with their cost class and model dependencies using dbt ls."""
+    command: list[str] = [
+        "dbt",
+        "--quiet",
+        "ls",
+        "--resource-type",
+        "model",
+        "--output",
+        "json",
+        "--output-keys",
+        "unique_id",
+        "name",
+        "depends_on",
+        "config",
+    ]
+    if select:
+        command += ["--select", *select]
+    result = subprocess.run(
+        command + dbt_args, capture_output=True, text=True, check=True
+    )
+
+    models: dict[str, ModelNode] = {}
+    for line in result.stdout.splitlines():
+        if not line.startswith("{"):
+            continue
+        node: dict[str, dict[str, object]] = json.loads(line)
+        meta: dict[str, object] = (
+            node["config"].get("meta") or {}
+        )  # pyright: ignore[reportAssignmentType]
+        unique_id: str = node["unique_id"]  # pyright: ignore[reportAssignmentType]
+        models[unique_id] = ModelNode(
+            unique_id=unique_id,
+            name=node["name"],  # pyright: ignore[reportArgumentType]
+            cost_class=str(meta.get("cost_class", "light")),
+            parents=set(
+                node["depends_on"]["nodes"]
+            ),  # pyright: ignore[reportArgumentType]
+        )
+
+    # Only dependencies within the selection need scheduling, anything else is assumed built.
+    for model in models.values():
+        model.parents &= models.keys()
+    return models
+
+
+def plan_rounds(models: dict[str, ModelNode]) -> list[tuple[list[str], int | None]]:
+    """
+    Split the models into rounds of (model names, threads).
+
+    A threads value of None means the round uses the --threads passed to the script.
+    """
+    ancestors: dict[str, set[str]] = {}
+
+    def get_ancestors(unique_id: str) -> set[str]:
+        if unique_id not in ancestors:
+            ancestors[unique_id] = set()
+            for parent in models[unique_id].parents:
+                ancestors[unique_id] |= {parent} | get_ancestors(parent)
+        return ancestors[unique_id]
+
+    pending: set[str] = set(models)
+    rounds: list[tuple[list[str], int | None]] = []
+    while pending:
+        pending_heavy: set[str] = {
+            unique_id
+            for unique_id in pending
+            if models[unique_id].cost_class == "heavy"
+        }
+
+        # Fan out everything that does not wait on a heavy model.
+        fan_out: set[str] = {
+            unique_id
+            for unique_id in pending - pending_heavy
+            if not get_ancestors(unique_id) & pending_heavy
+        }
+        if fan_out:
+            rounds.append(
+                (sorted(models[unique_id].name for unique_id in fan_out), None)
+            )
+            pending -= fan_out
+
+        # Then run the heavy models whose parents are all built, one at a time.
+        ready_heavy: set[str] = {
+            unique_id
+            for unique_id in pending_heavy
+            if not models[unique_id].parents & pending
+        }
+        if ready_heavy:
+            rounds.append(
+                (sorted(models[unique_id].name for unique_id in ready_heavy), 1)
+            )
+            pending -= ready_heavy
+
+    return rounds
+
+
+def main() -> None:
+    args: CliArgs = parse_cli_arguments()
+    dbt_vars: dict[str, object] = json.loads(args.vars) | {
+        "duckdb_cost_scheduling": True
+    }
+
+    models: dict[str, ModelNode] = list_models(args.select, args.dbt_args)
+    rounds: list[tuple[list[str], int | None]] = plan_rounds(models)
+    print(f" Scheduled {len(models)} models in {len(rounds)} rounds")
+
+    for index, (names, threads) in enumerate(rounds, start=1):
+        round_threads: int = threads or args.threads
+        round_settings: dict[str, object] = {"threads": args.threads}
+        if args.memory_limit:
+            round_settings["memory_limit"] = args.memory_limit
+        print(
+            f" Round {index}: {len(names)} model(s) with {round_threads} thread(s), DuckDB settings {round_settings}"
+        )
+        command: list[str] = [
+            "dbt",
+            "run",
+            "--select",
+            *names,
+            "--threads",
+            str(round_threads),
+            "--vars",
+            json.dumps(dbt_vars | {"duckdb_round_settings": round_settings}),
+            *args.dbt_args,
+        ]
+        if args.dry_run:
+            print("  " + " ".join(names))
+            continue
+        result = subprocess.run(command)
+        if result.returncode != 0:
+            sys.exit(result.returncode)
+
+    print("  Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = []
+# ///
+
+"""
+Typed schema catalogue for the OMOP CDM and Synthea source tables.
+
+The catalogue (schema_catalog.json, next to this file) is the single description of every
+table dbt-synthea reads or writes. It is generated from the OMOP CDM documentation by
+generate_dbt_yaml.py (the "cdm" group) and maintained by hand for the Synthea csv files
+(the "synthea" group). From it we generate:
+ - dbt YAML for the OMOP models (generate_dbt_yaml.py --source schema_catalog.json).
+ - Adapter specific DDL and post-load indexes (the `ddl` command and macros/schema_catalog.sql).
+ - Explicit column type maps used by csv_to_parquet.py and load_data_duckdb, so that
+   neither needs to sniff csv column types.
+
+Examples:
+./schema_catalog.py ddl vocabulary --dialect postgres --schema dbt_synthea_dev
+./schema_catalog.py types synthea --dialect duckdb
+./schema_catalog.py dbt-macro ../../macros/schema_catalog.sql
+"""
+
+import argparse
+import json
+import re
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+default_catalog_path: Path = Path(__file__).with_name("schema_catalog.json")
+catalog_version: int = 1
+
+# CDM tables populated from the Athena vocabulary download.
+vocabulary_tables: list[str] = [
+    "concept",
+    "vocabulary",
+    "domain",
+    "concept_class",
+    "concept_relationship",
+    "relationship",
+    "concept_synonym",
+    "concept_ancestor",
+    "source_to_concept_map",
+    "drug_strength",
+]
+
+dialects: list[str] = ["postgres", "duckdb"]
+
+# Catalogue datatypes (as written in the CDM documentation) to adapter types.
+# varchar(n) is handled separately in dialect_type.
+type_map: dict[str, dict[str, str]] = {
+    "integer": {"postgres": "INTEGER", "duckdb": "INTEGER"},
+    "bigint": {"postgres": "BIGINT", "duckdb": "BIGINT"},
+    "float": {"postgres": "NUMERIC", "duckdb": "DOUBLE"},
+    "date": {"postgres": "DATE", "duckdb": "DATE"},
+    "datetime": {"postgres": "TIMESTAMP", "duckdb": "TIMESTAMP"},
+    "timestamptz": {"postgres": "TIMESTAMPTZ", "duckdb": "TIMESTAMPTZ"},
+    "varchar(max)": {"postgres": "TEXT", "duckdb": "VARCHAR"},
+    "varchar": {"postgres": "VARCHAR", "duckdb": "VARCHAR"},
+}
+
+# DuckDB relies on zonemaps rather than secondary indexes, so indexes are only emitted for these.
+indexed_dialects: set[str] = {"postgres"}
+
+
+@dataclass
+class ColumnSpec:
+    """A single column as described by the CDM documentation."""
+
+    name: str
+    datatype: str
+    description: str = ""
+    etl_conventions: str = ""
+    required: bool = False
+    primary_key: bool = False
+    foreign_key: bool = False
+    foreign_key_table: str = ""
+    foreign_key_domain: str = ""
+
+
+@dataclass
+class TableSpec:
+    """A table, its columns and the indexes to create once it has been loaded."""
+
+    name: str
+    columns: list[ColumnSpec]
+    description: str = ""
+    indexes: list[list[str]] = field(default_factory=list)
+
+    def column_types(self, dialect: str) -> dict[str, str]:
+        """Return an ordered mapping of column name to adapter type."""
+        return {
+            column.name: dialect_type(column.datatype, dialect)
+            for column in self.columns
+        }
+
+
+@dataclass
+class SchemaCatalog:
+    """Tables grouped by where they come from, e.g. cdm or synthea."""
+
+    groups: dict[str, list[TableSpec]] = field(default_factory=dict)
+
+    def tables(self, group: str) -> list[TableSpec]:
+        """
+        Return the tables in a group.
+
+        The virtual "vocabulary" group is the subset of the cdm group loaded from Athena.
+        """
+        if group == "vocabulary":
+            by_name: dict[str, TableSpec] = {
+                table.name: table for table in self.groups.get("cdm", [])
+            }
+            return [by_name[name] for name in vocabulary_tables if name in by_name]
+        if group not in self.groups:
+            raise KeyError(f"No group named {group} in the schema catalogue.")
+        return self.groups[group]
+
+    def table(self, group: str, name: str) -> TableSpec | None:
+        """Return a single table from a group, or None if it is not catalogued."""
+        for table in self.tables(group):
+            if table.name == name.lower():
+                return table
+        return None
+
+
+def dialect_type(datatype: str, dialect: str) -> str:
+    """Translate a catalogue datatype into the type used by the given adapter."""
+    normalised: str = datatype.strip().lower()
+    if normalised in type_map:
+        return type_map[normalised][dialect]
+
+    varchar_match: re.Match[str] | None = re.fullmatch(r"varchar\((\d+)\)", normalised)
+    if varchar_match:
+        # DuckDB ignores varchar lengths, so keep its types minimal.
+        if dialect == "duckdb":
+            return "VARCHAR"
+        return f"VARCHAR({varchar_match.group(1)})"
+
+    return datatype.upper()
+
+
+def _compact(spec: object) -> dict[str, object]:
+    """Convert a dataclass to a dict, dropping fields left at their default value."""
+    compact: dict[str, object] = {}
+    for spec_field in fields(spec):  # pyright: ignore[reportArgumentType]
+        value: object = getattr(spec, spec_field.name)
+        if value == spec_field.default or value == []:
+            continue
+        compact[spec_field.name] = value
+    return compact
+
+
+def _serialise_table(table: TableSpec) -> str:
+    """Serialise a table with one column per line so catalogue diffs stay readable."""
+    header: dict[str, object] = _compact(table)
+    _ = header.pop("columns")
+    columns: str = ",\n".join(
+        f"    {json.dumps(_compact(column), ensure_ascii=False)}"
+        for column in table.columns
+    )
+    header_json: str = json.dumps(header, ensure_ascii=False)[:-1]
+    return f'   {header_json}, "columns": [\n{columns}\n   ]}}'
+
+
+def load_catalog(path: Path = default_catalog_path) -> SchemaCatalog:
+    """Load a schema catalogue from a json file."""
+    raw: dict[str, object] = json.loads(path.read_text())
+    groups: dict[str, list[dict[str, object]]] = raw[
+        "groups"
+    ]  # pyright: ignore[reportAssignmentType]
+    return SchemaCatalog(
+        groups={
+            group: [
+                TableSpec(
+                    name=table["name"],  # pyright: ignore[reportArgumentType]
+                    description=table.get(
+                        "description", ""
+                    ),  # pyright: ignore[reportArgumentType]
+                    indexes=table.get(
+                        "indexes", []
+                    ),  # pyright: ignore[reportArgumentType]
+                    columns=[
+                        ColumnSpec(**column)
+                        for column in table[
+                            "columns"
+                        ]  # pyright: ignore[reportGeneralTypeIssues]
+                    ],
+                )
+                for table in tables
+            ]
+            for group, tables in groups.items()
+        }
+    )
+
+
+def save_catalog(catalog: SchemaCatalog, path: Path = default_catalog_path) -> None:
+    """Save a schema catalogue as json, omitting default values to keep it compact."""
+    groups: list[str] = [
+        f' "{group}": [\n'
+        + ",\n".join(_serialise_table(table) for table in tables)
+        + "\n ]"
+        for group, tables in catalog.groups.items()
+    ]
+    groups_json: str = ",\n".join(groups)
+    _ = path.write_text(
+        f'{{"version": {catalog_version}, "groups": {{\n{groups_json}\n}}}}\n'
+    )
+
+
+def index_name(table: str, columns: list[str]) -> str:
+    """Name an index after its table and columns."""
+    return f"idx_{table}_{'_'.join(columns)}"
+
+
+def render_create_table(table: TableSpec, schema: str, dialect: str) -> str:
+    """Render a CREATE TABLE statement for the table."""
+    column_lines: list[str] = [
+        f'    "{column.name}" {dialect_type(column.datatype, dialect)}'
+        + (" NOT NULL" if column.required else " NULL")
+        for column in table.columns
+    ]
+    columns: str = ",\n".join(column_lines)
+    return f"CREATE TABLE IF NOT EXISTS {schema}.{table.name} (\n{columns}\n);"
+
+
+def render_create_indexes(table: TableSpec, schema: str, dialect: str) -> list[str]:
+    """Render the post-load CREATE INDEX statements for the table."""
+    if dialect not in indexed_dialects:
+        return []
+    return [
+        f"CREATE INDEX IF NOT EXISTS {index_name(table.name, columns)} "
+        + f"ON {schema}.{table.name} ({', '.join(columns)});"
+        for columns in table.indexes
+    ]
+
+
+def render_dbt_macro(catalog: SchemaCatalog, groups: list[str]) -> str:
+    """
+    Render macros/schema_catalog.sql.
+
+    Each adapter gets its own dispatched macro returning
+    {group: {table: {"columns": [[name, type, not_null], ...], "indexes": [[column, ...], ...]}}}.
+    """
+    lines: list[str] = [
+        "{# Generated by scripts/python/schema_catalog.py dbt-macro. Do not edit by hand. #}",
+        "",
+        "{% macro get_schema_catalog() %}",
+        "    {{ return(adapter.dispatch('get_schema_catalog')()) }}",
+        "{% endmacro %}",
+    ]
+    for dialect in dialects:
+        macro_prefix: str = "default" if dialect == "postgres" else dialect
+        payload: dict[str, dict[str, dict[str, list[list[object]]]]] = {
+            group: {
+                table.name: {
+                    "columns": [
+                        [
+                            column.name,
+                            dialect_type(column.datatype, dialect),
+                            column.required,
+                        ]
+                        for column in table.columns
+                    ],
+                    "indexes": table.indexes if dialect in indexed_dialects else [],
+                }
+                for table in catalog.tables(group)
+            }
+            for group in groups
+        }
+        lines += [
+            "",
+            f"{{% macro {macro_prefix}__get_schema_catalog() %}}",
+            f"    {{{{ return({json.dumps(payload)}) }}}}",
+            "{% endmacro %}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def parse_cli_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="""Generate DDL, column type maps and dbt macros from the schema catalogue."""
+    )
+    _ = parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=default_catalog_path,
+        help=f"Path to the schema catalogue. Defaults to {default_catalog_path.name} next to this script.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ddl_parser = subparsers.add_parser("ddl", help="Print CREATE TABLE statements.")
+    _ = ddl_parser.add_argument(
+        "group", help="Table group, e.g. vocabulary, synthea or cdm."
+    )
+    _ = ddl_parser.add_argument("--dialect", "-d", choices=dialects, default="postgres")
+    _ = ddl_parser.add_argument(
+        "--schema", "-s", default="public", help="Target schema."
+    )
+    _ = ddl_parser.add_argument(
+        "--indexes",
+        "-i",
+        action="store_true",
+        help="Print the post-load CREATE INDEX statements instead of the tables.",
+    )
+
+    types_parser = subparsers.add_parser(
+        "types", help="Print column type maps as json."
+    )
+    _ = types_parser.add_argument(
+        "group", help="Table group, e.g. vocabulary, synthea or cdm."
+    )
+    _ = types_parser.add_argument("--dialect", "-d", choices=dialects, default="duckdb")
+
+    macro_parser = subparsers.add_parser(
+        "dbt-macro", help="Write the dbt schema catalogue macro."
+    )
+    _ = macro_parser.add_argument("output", type=Path, help="Path to the macro file.")
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args: argparse.Namespace = parse_cli_arguments()
+    catalog: SchemaCatalog = load_catalog(args.catalog)
+
+    if args.command == "ddl":
+        for table in catalog.tables(args.group):
+            if args.indexes:
+                for statement in render_create_indexes(
+                    table, args.schema, args.dialect
+                ):
+                    print(statement)
+            else:
+                print(render_create_table(table, args.schema, args.dialect))
+    elif args.command == "types":
+        type_maps: dict[str, dict[str, str]] = {
+            table.name: table.column_types(args.dialect)
+            for table in catalog.tables(args.group)
+        }
+        print(json.dumps(type_maps, indent=2))
+    elif args.command == "dbt-macro":
+        _ = args.output.write_text(render_dbt_macro(catalog, ["vocabulary", "synthea"]))
+        print(f" Exported to `{args.output}`")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,17 @@
 
 # used to generate seed vocabulary subset
 # this script saves vocabulary subset tables from a duckdb as csvs
+# a checksum of each exported table is kept in the output directory, so with --overwrite only changed tables are rewritten
 
 import argparse
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
 import duckdb
 
+
 @dataclass
 class CliArgs:
     """A dataclass to ensure correct typing of command line arguments"""
@@ -23,6 +26,10 @@ class CliArgs:
     source_schema: str = str()
     overwrite: bool = False
 
+
+checksums_name: str = ".shard_checksums.json"
+
+
 def parse_cli_arguments() -> tuple[Path, Path, str]:
     """
     Parse command line arguments.
@@ -39,7 +46,9 @@ def parse_cli_arguments() -> tuple[Path, Path, str]:
 
     # duckdb database file.
     _ = parser.add_argument(
-        "db_file", type=Path, help="Path to the duckdb database where the vocabulary shard is stored"
+        "db_file",
+        type=Path,
+        help="Path to the duckdb database where the vocabulary shard is stored",
     )
 
     # Output Directory.
@@ -57,6 +66,7 @@ def parse_cli_arguments() -> tuple[Path, Path, str]:
         "-o",
         action="store_true",
         help="""Pass --overwrite or -o to overwrite csv files in the target directory.
+        Only tables that changed since they were last exported are rewritten.
         If not passed then the script will abort if the output directory contains ANY csv files.""",
     )
 
@@ -70,9 +80,7 @@ def parse_cli_arguments() -> tuple[Path, Path, str]:
     if output_dir.exists():
         if not output_dir.is_dir():
             parser.exit(1, f"{args.output_dir} exists but is not a directory.")
-        if not args.overwrite and (
-            any(output_dir.glob("*.csv"))
-        ):
+        if not args.overwrite and (any(output_dir.glob("*.csv"))):
             parser.exit(
                 1,
                 f"""Exiting because {args.output_dir} contains .csv files.
@@ -84,10 +92,11 @@ def parse_cli_arguments() -> tuple[Path, Path, str]:
     # Check on db file.
     db_file = Path(args.db_file)
     if not db_file.exists():
-        parser.exit(1, f"Source database does not exist: {db_file}")   
+        parser.exit(1, f"Source database does not exist: {db_file}")
 
     return db_file, output_dir, source_schema
 
+
 def main(
     db_file: Path,
     output_dir: Path,
@@ -96,30 +105,53 @@ def main(
     """Main function to export vocabulary shard tables from a duckdb database to csv files."""
     conn: duckdb.DuckDBPyConnection = duckdb.connect(db_file)
 
+    # Tables starting with an underscore hold shard state, see generate_vocab_shard.py.
     tables_query: str = f"""
         SELECT table_name
         FROM information_schema.tables
         WHERE table_schema = '{source_schema}'
+            AND NOT starts_with(table_name, '_')
         """
 
     # Fetch all table names in schema. Cast as strings for type safety.
-    raw_rows: list[tuple[str]] = cast(list[tuple[str]], conn.sql(tables_query).fetchall())
+    raw_rows: list[tuple[str]] = cast(
+        list[tuple[str]], conn.sql(tables_query).fetchall()
+    )
 
     # From the list of table names create a list of tuples containing table_name and csv_path.
     tables_names_and_paths: list[tuple[str, Path]] = [
         (name, output_dir / f"{name}.csv") for (name,) in raw_rows
     ]
 
-    # Iterate over each table and export to CSV.
+    # Checksums of the tables as last exported.
+    checksums_path: Path = output_dir / checksums_name
+    checksums: dict[str, str] = (
+        json.loads(checksums_path.read_text()) if checksums_path.exists() else {}
+    )
+
+    # Iterate over each table and export to CSV, skipping tables unchanged since the last export.
     for table_name, csv_path in tables_names_and_paths:
+        checksum_row = conn.sql(
+            f"SELECT count(*), sum(hash(t)) FROM {source_schema}.{table_name} AS t"
+        ).fetchone()
+        checksum: str = (
+            f"{checksum_row[0]}:{checksum_row[1]}"  # pyright: ignore[reportOptionalSubscript]
+        )
+        if csv_path.exists() and checksums.get(table_name) == checksum:
+            print(f"Table '{table_name}' unchanged, skipping")
+            continue
         _ = conn.execute(
             f"COPY {source_schema}.{table_name} TO '{csv_path}' (HEADER, DELIMITER ',');"
         )
+        checksums[table_name] = checksum
         print(f"Table '{table_name}' exported to {csv_path}")
-    
+
+    _ = checksums_path.write_text(json.dumps(checksums, indent=2, sort_keys=True))
+
     print(f" Exported all to `{output_dir}`")
     print("  Done!")
 
+
 if __name__ == "__main__":
     db_file, output_dir, source_schema = parse_cli_arguments()
     main(db_file, output_dir, source_schema)
@@ -0,0 +1,5 @@
+-- int__drug_ingredient is incremental: fail if it was not rebuilt from the current vocabulary,
+-- i.e. its stored vocabulary key differs from the key of the current vocabulary.
+SELECT DISTINCT vocabulary_key
+FROM {{ ref('int__drug_ingredient') }}
+WHERE vocabulary_key IS DISTINCT FROM ({{ drug_ingredient_source_key() }})